@@ -1,32 +1,63 @@
 """
 Configuration settings module for the Agentic Assistant.
 
-This module handles application configuration using Pydantic Settings,
-which automatically loads environment variables and provides type safety.
+This module handles application configuration. Settings are read once per
+process from the .env file and environment variables into a frozen dataclass.
 """
 
-from pydantic_settings import BaseSettings
+import os
+from dataclasses import dataclass
+from typing import Optional
+from dotenv import dotenv_values
 
-class Settings(BaseSettings):
+@dataclass(frozen=True)
+class Settings:
     """
     Application settings class that defines all configuration parameters.
     
-    This class uses Pydantic's BaseSettings to automatically load
-    environment variables and provide type validation. All settings
-    are loaded from the .env file or environment variables.
+    Values are loaded from the .env file (UTF-8) and environment variables,
+    with environment variables taking precedence. Use Settings.from_env()
+    to build an instance.
     """
     # API key for Anthropic Claude model
     ANTHROPIC_API_KEY: str
+    # Optional SQLite file that keeps LLM responses across runs (in memory only if unset)
+    LLM_CACHE_PATH: Optional[str] = None
 
-    class Config:
+    @classmethod
+    def from_env(cls, env_file: str = ".env") -> "Settings":
         """
-        Pydantic configuration for settings loading.
+        Build settings from the .env file and environment variables.
         
-        Specifies that settings should be loaded from a .env file
-        with UTF-8 encoding.
+        Args:
+            env_file (str): Path to the .env file to load
+            
+        Returns:
+            Settings: The loaded application settings
         """
-        env_file = ".env"  # Load environment variables from .env file
-        env_file_encoding = "utf-8"  # Use UTF-8 encoding for the .env file
+        # Environment variables override values from the .env file
+        values = {**dotenv_values(env_file, encoding="utf-8"), **os.environ}
+        try:
+            return cls(
+                ANTHROPIC_API_KEY=values["ANTHROPIC_API_KEY"],
+                LLM_CACHE_PATH=values.get("LLM_CACHE_PATH") or None,
+            )
+        except KeyError as missing:
+            raise RuntimeError(
+                f"Missing required setting {missing}. "
+                f"Add it to '{env_file}' or set it as an environment variable."
+            ) from None
 
-# Global settings instance that can be imported throughout the application
-settings = Settings()
\ No newline at end of file
+# Global settings instance, created on first access so importing this module
+# doesn't read .env. `from backend.config.settings import settings` still works.
+_settings: Optional[Settings] = None
+
+
+def __getattr__(name: str):
+    """Lazily create the global settings instance (PEP 562)."""
+    global _settings
+    if name == "settings":
+        if _settings is None:
+            _settings = Settings.from_env()
+        return _settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
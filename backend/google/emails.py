@@ -5,8 +5,7 @@ This module defines the Email class that represents Gmail messages
 with all their metadata, content, and processing information.
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime
+__all__ = ['Email']
 
 class Email:
     """
@@ -18,50 +17,76 @@ class Email:
     the application.
     """
     
-    def __init__(self):
-        """
-        Initialize a new Email instance with default values.
-        
-        All fields are initialized with appropriate default values
-        to ensure the object is always in a valid state.
-        """
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'id', 'thread_id', 'message_id',
+        'subject', 'from_email', 'from_name', 'from_address', 'to', 'cc', 'bcc', 'reply_to',
+        'date', 'received_date', 'sent_date',
+        'body_text', 'body_html', 'snippet',
+        'size_estimate', 'internal_date',
+        'headers',
+        'raw_message',
+        'draft', 'draft_id', 'ready_to_send', 'status',
+    )
+    
+    # Defaults for fields that were never set, served by __getattr__. Slots start
+    # empty, so creating an instance stores nothing and each field costs a store only
+    # when it's set. Lists and dicts are factories: a fresh one per instance
+    _DEFAULTS = {
         # Basic identifiers for Gmail API and email standards
-        self.id: str = ""                    # Gmail message ID (unique identifier)
-        self.thread_id: str = ""             # Gmail thread ID (conversation grouping)
-        self.message_id: str = ""            # RFC 2822 Message-ID header (email standard)
-        
+        'id': "",               # Gmail message ID (unique identifier)
+        'thread_id': "",        # Gmail thread ID (conversation grouping)
+        'message_id': "",       # RFC 2822 Message-ID header (email standard)
+
         # Header information extracted from email headers
-        self.subject: str = ""               # Email subject line
-        self.from_email: str = ""            # Full "Name <email@domain.com>" format
-        self.from_name: str = ""             # Just the name part of sender
-        self.from_address: str = ""          # Just the email address part of sender
-        self.to: List[str] = []              # List of primary recipients
-        self.cc: List[str] = []              # List of CC recipients
-        self.bcc: List[str] = []             # List of BCC recipients (rarely available)
-        self.reply_to: str = ""              # Reply-To header (where replies should go)
-        
+        'subject': "",          # Email subject line
+        'from_email': "",       # Full "Name <email@domain.com>" format
+        'from_name': "",        # Just the name part of sender
+        'from_address': "",     # Just the email address part of sender
+        'to': list,             # List of primary recipients
+        'cc': list,             # List of CC recipients
+        'bcc': list,            # List of BCC recipients (rarely available)
+        'reply_to': "",         # Reply-To header (where replies should go)
+
         # Dates and timing information
-        self.date: str = ""                  # Original Date header from email
-        self.received_date: datetime = None   # When Gmail received the email
-        self.sent_date: datetime = None      # Parsed from Date header (when sender sent it)
-        
+        'date': "",             # Original Date header from email
+        'received_date': None,  # When Gmail received the email (UTC)
+        'sent_date': None,      # Parsed from Date header (when sender sent it)
+
         # Email content in different formats
-        self.body_text: str = ""             # Plain text version of email body
-        self.body_html: str = ""             # HTML version of email body
-        self.snippet: str = ""               # Gmail's snippet (preview text)
-        
+        'body_text': "",        # Plain text version of email body
+        'body_html': "",        # HTML version of email body
+        'snippet': "",          # Gmail's snippet (preview text)
+
         # Size and technical details
-        self.size_estimate: int = 0          # Size in bytes (Gmail's estimate)
-        self.internal_date: str = ""         # Gmail's internal timestamp
-        
+        'size_estimate': 0,     # Size in bytes (Gmail's estimate)
+        'internal_date': "",    # Gmail's internal timestamp
+
         # Additional headers (store as dict for flexibility)
-        self.headers: Dict[str, str] = {}    # All other email headers as key-value pairs
-        
+        'headers': dict,        # Parsed headers (Subject, From, To, ...); full list is in raw_message
+
         # Processing metadata
-        self.raw_message: Dict = {}          # Store original Gmail API response if needed
+        'raw_message': dict,    # Store original Gmail API response if needed
 
         # Drafts
-        self.draft: str = ""                 # AI-generated draft response to this email
-        self.draft_id: str = ""              # Google message id for the draft
-        self.ready_to_send: bool = False      # Whether the draft is ready to send, True if user has revied draft
-        self.status: str = ""                 # Status of the draft, either '' or 'sent' if sent
+        'draft': "",            # AI-generated draft response to this email
+        'draft_id': "",         # Google message id for the draft
+        'ready_to_send': False, # Whether the draft is ready to send, True if user has revied draft
+        'status': "",           # Status of the draft, either '' or 'sent' if sent
+    }
+    
+    def __getattr__(self, name: str):
+        """
+        Return the default value of a field that hasn't been set.
+        
+        Only called when normal lookup fails, i.e. for empty slots. A new list
+        or dict default is stored on the instance, so changes made to it stick.
+        """
+        try:
+            default = Email._DEFAULTS[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        if callable(default):
+            default = default()
+            setattr(self, name, default)
+        return default
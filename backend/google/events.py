@@ -5,9 +5,6 @@ This module defines the Event class that represents Google Calendar events
 with all their metadata, content, and processing information.
 """
 
-from typing import List, Dict, Optional
-from datetime import datetime
-
 class Event:
     """
     Event model to represent Google Calendar events.
@@ -18,58 +15,86 @@ class Event:
     the application.
     """
     
-    def __init__(self):
-        """
-        Initialize a new Event instance with default values.
-        
-        All fields are initialized with appropriate default values
-        to ensure the object is always in a valid state.
-        """
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        'id', 'calendar_id', 'html_link',
+        'summary', 'description', 'location',
+        'start_time', 'end_time', 'start_date', 'end_date', 'is_all_day', 'timezone',
+        'attendees', 'organizer',
+        'status', 'visibility', 'transparency',
+        'recurrence', 'recurring_event_id',
+        'reminders', 'notifications',
+        'created', 'updated', 'creator', 'original_start_time',
+        'raw_event',
+        'ai_summary', 'ai_analysis', 'processing_status',
+    )
+    
+    # Defaults for fields that were never set, served by __getattr__. Slots start
+    # empty, so creating an instance stores nothing and each field costs a store only
+    # when it's set. Lists and dicts are factories: a fresh one per instance
+    _DEFAULTS = {
         # Basic identifiers for Google Calendar API
-        self.id: str = ""                    # Google Calendar event ID (unique identifier)
-        self.calendar_id: str = ""           # Calendar ID where the event belongs
-        self.html_link: str = ""             # Web link to view the event
-        
+        'id': "",                    # Google Calendar event ID (unique identifier)
+        'calendar_id': "",           # Calendar ID where the event belongs
+        'html_link': "",             # Web link to view the event
+
         # Event basic information
-        self.summary: str = ""               # Event title/summary
-        self.description: str = ""           # Event description
-        self.location: str = ""              # Event location
-        
+        'summary': "",               # Event title/summary
+        'description': "",           # Event description
+        'location': "",              # Event location
+
         # Timing information
-        self.start_time: datetime = None     # Event start time
-        self.end_time: datetime = None       # Event end time
-        self.start_date: str = ""            # Start date (for all-day events)
-        self.end_date: str = ""              # End date (for all-day events)
-        self.is_all_day: bool = False        # Whether this is an all-day event
-        self.timezone: str = ""              # Event timezone
-        
+        'start_time': None,          # Event start time
+        'end_time': None,            # Event end time
+        'start_date': "",            # Start date (for all-day events)
+        'end_date': "",              # End date (for all-day events)
+        'is_all_day': False,         # Whether this is an all-day event
+        'timezone': "",              # Event timezone
+
         # Attendee information
-        self.attendees: List[Dict] = []      # List of attendee objects with email, name, response status
-        self.organizer: Dict = {}            # Organizer information (email, name, self)
-        
+        'attendees': list,           # List of attendee objects with email, name, response status
+        'organizer': dict,           # Organizer information (email, name, self)
+
         # Event status and visibility
-        self.status: str = ""                # Event status (confirmed, tentative, cancelled)
-        self.visibility: str = ""            # Event visibility (default, public, private, confidential)
-        self.transparency: str = ""          # Event transparency (opaque, transparent)
-        
+        'status': "",                # Event status (confirmed, tentative, cancelled)
+        'visibility': "",            # Event visibility (default, public, private, confidential)
+        'transparency': "",          # Event transparency (opaque, transparent)
+
         # Recurrence information
-        self.recurrence: List[str] = []      # Recurrence rules (RRULE, EXDATE, etc.)
-        self.recurring_event_id: str = ""    # ID of the recurring event series
-        
+        'recurrence': list,          # Recurrence rules (RRULE, EXDATE, etc.)
+        'recurring_event_id': "",    # ID of the recurring event series
+
         # Reminders and notifications
-        self.reminders: Dict = {}            # Reminder settings (useDefault, overrides)
-        self.notifications: List[Dict] = []  # Notification settings
-        
+        'reminders': dict,           # Reminder settings (useDefault, overrides)
+        'notifications': list,       # Notification settings
+
         # Additional metadata
-        self.created: datetime = None        # When the event was created
-        self.updated: datetime = None        # When the event was last updated
-        self.creator: Dict = {}              # Creator information
-        self.original_start_time: datetime = None  # Original start time for recurring events
-        
+        'created': None,             # When the event was created
+        'updated': None,             # When the event was last updated
+        'creator': dict,             # Creator information
+        'original_start_time': None, # Original start time for recurring events
+
         # Processing metadata
-        self.raw_event: Dict = {}            # Store original Google Calendar API response if needed
-        
+        'raw_event': dict,           # Store original Google Calendar API response if needed
+
         # AI processing fields
-        self.ai_summary: str = ""            # AI-generated summary of the event
-        self.ai_analysis: str = ""           # AI analysis of the event content
-        self.status: str = ""                # Processing status (pending, processed, error) 
\ No newline at end of file
+        'ai_summary': "",            # AI-generated summary of the event
+        'ai_analysis': "",           # AI analysis of the event content
+        'processing_status': "",     # Processing status (pending, processed, error)
+    }
+    
+    def __getattr__(self, name: str):
+        """
+        Return the default value of a field that hasn't been set.
+        
+        Only called when normal lookup fails, i.e. for empty slots. A new list
+        or dict default is stored on the instance, so changes made to it stick.
+        """
+        try:
+            default = Event._DEFAULTS[name]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+        if callable(default):
+            default = default()
+            setattr(self, name, default)
+        return default
@@ -6,8 +6,11 @@ handling calendar events, scheduling, and meeting management. It inherits
 from BaseGoogleClient for authentication and shared functionality.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional
 from datetime import datetime, timedelta, timezone
+import functools
+import sys
+import time
 from googleapiclient.errors import HttpError
 
 from backend.google.base_client import BaseGoogleClient
@@ -16,6 +19,80 @@ from backend.google.events import Event
 # Import unified scopes from base client
 from backend.google.base_client import UNIFIED_SCOPES
 
+# How long the primary calendar ID is reused before it is looked up again
+PRIMARY_CALENDAR_TTL = 300  # seconds
+
+# Calendar API limit on events returned by a single events().list page
+MAX_EVENTS_PER_PAGE = 2500
+
+# Calendar API limit on calendars in a single freebusy query
+MAX_FREEBUSY_CALENDARS = 50
+
+try:
+    # Optional C parser, much faster than the stdlib for large event lists
+    from ciso8601 import parse_datetime as _parse_rfc3339
+except ImportError:
+    def _parse_rfc3339(value: str) -> datetime:
+        """Parse an RFC 3339 timestamp (e.g. '2024-01-15T10:00:00Z') from the Calendar API."""
+        if sys.version_info >= (3, 11):
+            # fromisoformat accepts a trailing 'Z' natively since Python 3.11
+            return datetime.fromisoformat(value)
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+@functools.lru_cache(maxsize=1024)
+def _attendee_entry(email: str) -> Dict[str, str]:
+    """Return the attendee body for an email, reused for repeat recipients. Treat as read-only."""
+    return {'email': email}
+
+# Top-level event fields copied onto Event objects: (API field, Event attribute, converter).
+# Nested start/end/originalStartTime values are handled separately in _raw_to_event.
+_EVENT_SCHEMA = (
+    ('id', 'id', None),
+    ('htmlLink', 'html_link', None),
+    ('summary', 'summary', None),
+    ('description', 'description', None),
+    ('location', 'location', None),
+    ('attendees', 'attendees', None),
+    ('organizer', 'organizer', None),
+    ('status', 'status', None),
+    ('visibility', 'visibility', None),
+    ('transparency', 'transparency', None),
+    ('recurrence', 'recurrence', None),
+    ('recurringEventId', 'recurring_event_id', None),
+    ('reminders', 'reminders', None),
+    ('created', 'created', _parse_rfc3339),
+    ('updated', 'updated', _parse_rfc3339),
+    ('creator', 'creator', None),
+)
+
+def _build_schema_applier(schema) -> Callable[[Event, Dict[str, Any]], None]:
+    """
+    Generate a function that copies the schema's fields from a raw event onto an Event.
+    
+    The function is built from unrolled source (one membership test and one
+    attribute store per field, with the field names as constants), so
+    converting an event doesn't loop over the schema or call setattr.
+    """
+    lines = ["def _apply_event_schema(event, raw_event):"]
+    namespace = {}
+    for index, (field, attr, convert) in enumerate(schema):
+        value = f"raw_event[{field!r}]"
+        if convert:
+            namespace[f"_convert_{index}"] = convert
+            value = f"_convert_{index}({value})"
+        lines.append(f"    if {field!r} in raw_event:")
+        lines.append(f"        event.{attr} = {value}")
+    exec("\n".join(lines), namespace)
+    return namespace["_apply_event_schema"]
+
+# Copies the top-level _EVENT_SCHEMA fields in _raw_to_event
+_apply_event_schema = _build_schema_applier(_EVENT_SCHEMA)
+
+# Partial-response field selections, derived from the schema so the API only
+# sends what _raw_to_event reads
+_EVENT_FIELDS = ",".join([field for field, _, _ in _EVENT_SCHEMA] + ['start', 'end', 'originalStartTime'])
+_EVENT_LIST_FIELDS = f"items({_EVENT_FIELDS}),nextPageToken"
+
 class GoogleCalendarClient(BaseGoogleClient):
     """
     Google Calendar API client for handling calendar operations.
@@ -24,6 +101,8 @@ class GoogleCalendarClient(BaseGoogleClient):
     def __init__(self, credentials_path: str = "credentials.json", token_path: str = "token.json"):
         super().__init__(credentials_path, token_path, UNIFIED_SCOPES)
         self.service = None
+        self._primary_cal_id: Optional[str] = None  # Cached result of get_primary_calendar_id
+        self._primary_cal_id_fetched_at: float = 0.0  # time.monotonic() of the last lookup
         self.authenticate()
 
     def authenticate(self) -> bool:
@@ -36,25 +115,33 @@ class GoogleCalendarClient(BaseGoogleClient):
         return False
 
     def get_primary_calendar_id(self) -> str:
-        """Return the user's primary calendar ID."""
+        """Return the user's primary calendar ID, cached for PRIMARY_CALENDAR_TTL seconds."""
+        if self._primary_cal_id and time.monotonic() - self._primary_cal_id_fetched_at < PRIMARY_CALENDAR_TTL:
+            return self._primary_cal_id
         try:
-            calendars = self.service.calendarList().list().execute().get('items', [])
-            for cal in calendars:
-                if cal.get('primary'):
-                    return cal['id']
-            return calendars[0]['id'] if calendars else 'primary'
+            calendars = self._execute_with_retry(self.service.calendarList().list()).get('items', [])
+            primary = next((cal['id'] for cal in calendars if cal.get('primary')), None)
+            if primary is None:
+                primary = calendars[0]['id'] if calendars else 'primary'
         except HttpError as e:
+            # Don't cache the fallback so the next call retries the lookup
             print(f"Error fetching primary calendar: {e}")
             return 'primary'
+        self._primary_cal_id = primary
+        self._primary_cal_id_fetched_at = time.monotonic()
+        return primary
 
-    def get_events(
+    def iter_event_pages(
         self,
         calendar_id: Optional[str] = None,
         max_results: int = 10,
         time_min: Optional[datetime] = None,
         time_max: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
-        """Fetch events in a time window."""
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch events in a time window, yielding one page of raw events at a time.
+
+        Follows nextPageToken until max_results events have been returned in total.
+        """
         if not calendar_id:
             calendar_id = self.get_primary_calendar_id()
         if time_min is None:
@@ -62,23 +149,85 @@ class GoogleCalendarClient(BaseGoogleClient):
         if time_max is None:
             time_max = time_min + timedelta(days=7)
 
-        try:
-            return self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=time_min.isoformat(),
-                timeMax=time_max.isoformat(),
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute().get('items', [])
-        except HttpError as e:
-            print(f"Error getting events: {e}")
-            return []
+        remaining = max_results
+        page_token = None
+        while remaining > 0:
+            try:
+                response = self._execute_with_retry(self.service.events().list(
+                    calendarId=calendar_id,
+                    timeMin=time_min.isoformat(),
+                    timeMax=time_max.isoformat(),
+                    maxResults=min(remaining, MAX_EVENTS_PER_PAGE),
+                    singleEvents=True,
+                    orderBy='startTime',
+                    pageToken=page_token,
+                    fields=_EVENT_LIST_FIELDS
+                ))
+            except HttpError as e:
+                print(f"Error getting events: {e}")
+                return
+            items = response.get('items', [])[:remaining]
+            if items:
+                yield items
+            remaining -= len(items)
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return
 
-    def get_events_as_objects(self, calendar_id: Optional[str] = None, max_results: int = 10, time_min: Optional[datetime] = None, time_max: Optional[datetime] = None) -> List[Event]:
-        """Fetch events and return them as Event objects."""
-        raw_events = self.get_events(calendar_id, max_results, time_min, time_max)
-        return [self._raw_to_event(event) for event in raw_events]
+    def iter_events(
+        self,
+        calendar_id: Optional[str] = None,
+        max_results: int = 10,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Fetch events in a time window, yielding raw events across all pages."""
+        for page in self.iter_event_pages(calendar_id, max_results, time_min, time_max):
+            yield from page
+
+    def get_events(
+        self,
+        calendar_id: Optional[str] = None,
+        max_results: int = 10,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch events in a time window."""
+        return list(self.iter_events(calendar_id, max_results, time_min, time_max))
+
+    def iter_events_as_objects(
+        self,
+        calendar_id: Optional[str] = None,
+        max_results: int = 10,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        include_raw: bool = False
+    ) -> Iterator[Event]:
+        """Fetch events and yield them one at a time as Event objects.
+
+        Pages are converted as they arrive, so memory stays bounded by one page.
+        Set include_raw=True to keep the raw API response on each Event.
+        """
+        if not calendar_id:
+            calendar_id = self.get_primary_calendar_id()
+
+        for raw_events in self.iter_event_pages(calendar_id, max_results, time_min, time_max):
+            for raw_event in raw_events:
+                event = self._raw_to_event(raw_event, include_raw)
+                # Event resources don't include their calendar, so record the one we queried
+                event.calendar_id = calendar_id
+                yield event
+
+    def get_events_as_objects(
+        self,
+        calendar_id: Optional[str] = None,
+        max_results: int = 10,
+        time_min: Optional[datetime] = None,
+        time_max: Optional[datetime] = None,
+        include_raw: bool = False
+    ) -> List[Event]:
+        """Fetch events and return them as a list of Event objects."""
+        return list(self.iter_events_as_objects(calendar_id, max_results, time_min, time_max, include_raw))
 
     def get_upcoming_events(self, days: int = 7, max_results: int = 10, calendar_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get upcoming events for the specified number of days."""
@@ -104,67 +253,40 @@ class GoogleCalendarClient(BaseGoogleClient):
             time_max=time_max
         )
 
-    def _raw_to_event(self, raw_event: Dict[str, Any]) -> Event:
-        """Convert a raw Google Calendar API response to an Event object."""
+    def _raw_to_event(self, raw_event: Dict[str, Any], include_raw: bool = False) -> Event:
+        """Convert a raw Google Calendar API response to an Event object.
+
+        Unset fields read as their defaults (Event._DEFAULTS), so only fields present in the response are set.
+        The raw response is only kept on the Event when include_raw is True.
+        """
         event = Event()
         
-        # Basic identifiers
-        event.id = raw_event.get('id', '')
-        event.calendar_id = raw_event.get('calendarId', '')
-        event.html_link = raw_event.get('htmlLink', '')
-        
-        # Event basic information
-        event.summary = raw_event.get('summary', '')
-        event.description = raw_event.get('description', '')
-        event.location = raw_event.get('location', '')
+        _apply_event_schema(event, raw_event)
         
         # Timing information
         start = raw_event.get('start', {})
         end = raw_event.get('end', {})
         
         if 'dateTime' in start:
-            event.start_time = datetime.fromisoformat(start['dateTime'].replace('Z', '+00:00'))
+            event.start_time = _parse_rfc3339(start['dateTime'])
             event.timezone = start.get('timeZone', '')
-            event.is_all_day = False
         elif 'date' in start:
             event.start_date = start['date']
             event.is_all_day = True
             
         if 'dateTime' in end:
-            event.end_time = datetime.fromisoformat(end['dateTime'].replace('Z', '+00:00'))
+            event.end_time = _parse_rfc3339(end['dateTime'])
         elif 'date' in end:
             event.end_date = end['date']
         
-        # Attendee information
-        event.attendees = raw_event.get('attendees', [])
-        event.organizer = raw_event.get('organizer', {})
-        
-        # Event status and visibility
-        event.status = raw_event.get('status', '')
-        event.visibility = raw_event.get('visibility', '')
-        event.transparency = raw_event.get('transparency', '')
-        
-        # Recurrence information
-        event.recurrence = raw_event.get('recurrence', [])
-        event.recurring_event_id = raw_event.get('recurringEventId', '')
-        
-        # Reminders and notifications
-        event.reminders = raw_event.get('reminders', {})
-        
-        # Additional metadata
-        if 'created' in raw_event:
-            event.created = datetime.fromisoformat(raw_event['created'].replace('Z', '+00:00'))
-        if 'updated' in raw_event:
-            event.updated = datetime.fromisoformat(raw_event['updated'].replace('Z', '+00:00'))
-        
-        event.creator = raw_event.get('creator', {})
         if 'originalStartTime' in raw_event:
             original_start = raw_event['originalStartTime']
             if 'dateTime' in original_start:
-                event.original_start_time = datetime.fromisoformat(original_start['dateTime'].replace('Z', '+00:00'))
+                event.original_start_time = _parse_rfc3339(original_start['dateTime'])
         
-        # Store raw event for reference
-        event.raw_event = raw_event
+        # Store raw event for reference (often the largest field, so opt-in)
+        if include_raw:
+            event.raw_event = raw_event
         
         return event
 
@@ -245,14 +367,14 @@ class GoogleCalendarClient(BaseGoogleClient):
         if location:
             event['location'] = location
         if attendees:
-            event['attendees'] = [{'email': email} for email in attendees]
+            event['attendees'] = [_attendee_entry(email) for email in attendees]
 
         try:
-            return self.service.events().insert(
+            return self._execute_with_retry(self.service.events().insert(
                 calendarId=calendar_id,
                 body=event,
                 sendUpdates='all'
-            ).execute()
+            ))
         except HttpError as e:
             print(f"Error creating event: {e}")
             return None
@@ -263,22 +385,19 @@ class GoogleCalendarClient(BaseGoogleClient):
         calendar_id: Optional[str] = None,
         **changes
     ) -> Optional[Dict[str, Any]]:
-        """Update fields of an existing event."""
+        """Update fields of an existing event.
+
+        Sends only the changed fields with a single PATCH request. The API
+        returns a 400 error for invalid fields.
+        """
         if not calendar_id:
             calendar_id = self.get_primary_calendar_id()
         try:
-            event = self.service.events().get(
-                calendarId=calendar_id,
-                eventId=event_id
-            ).execute()
-            for key, val in changes.items():
-                if key in event:
-                    event[key] = val
-            return self.service.events().update(
+            return self._execute_with_retry(self.service.events().patch(
                 calendarId=calendar_id,
                 eventId=event_id,
-                body=event
-            ).execute()
+                body=changes
+            ))
         except HttpError as e:
             print(f"Error updating event {event_id}: {e}")
             return None
@@ -292,10 +411,10 @@ class GoogleCalendarClient(BaseGoogleClient):
         if not calendar_id:
             calendar_id = self.get_primary_calendar_id()
         try:
-            self.service.events().delete(
+            self._execute_with_retry(self.service.events().delete(
                 calendarId=calendar_id,
                 eventId=event_id
-            ).execute()
+            ))
             return True
         except HttpError as e:
             print(f"Error deleting event {event_id}: {e}")
@@ -306,36 +425,64 @@ class GoogleCalendarClient(BaseGoogleClient):
         duration_minutes: int = 60,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        calendar_id: Optional[str] = None
+        calendar_id: Optional[str] = None,
+        calendar_ids: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Return free time slots between start_date and end_date."""
+        """Return time slots between start_date and end_date that are free on every calendar.
+
+        Pass calendar_ids to check several calendars at once (defaults to
+        calendar_id, or the primary calendar). Up to 50 calendars are checked
+        per freebusy query.
+        """
         if start_date is None:
             start_date = datetime.now(timezone.utc)
         if end_date is None:
             end_date = start_date + timedelta(days=7)
-        busy = self.service.freebusy().query(
-            body={
-                'timeMin': start_date.isoformat(),
-                'timeMax': end_date.isoformat(),
-                'items': [{'id': calendar_id or self.get_primary_calendar_id()}]
-            }
-        ).execute()['calendars']
-        busy_slots = busy.get(calendar_id or self.get_primary_calendar_id(), {}).get('busy', [])
+        if not calendar_ids:
+            calendar_ids = [calendar_id or self.get_primary_calendar_id()]
+
+        busy_slots: List[Dict[str, str]] = []
+        for start in range(0, len(calendar_ids), MAX_FREEBUSY_CALENDARS):
+            chunk = calendar_ids[start:start + MAX_FREEBUSY_CALENDARS]
+            busy = self._execute_with_retry(self.service.freebusy().query(
+                body={
+                    'timeMin': start_date.isoformat(),
+                    'timeMax': end_date.isoformat(),
+                    'items': [{'id': cid} for cid in chunk]
+                }
+            ))['calendars']
+            for cid in chunk:
+                busy_slots.extend(busy.get(cid, {}).get('busy', []))
+
+        # Parse each busy slot once and merge overlapping or touching slots
+        intervals = sorted(
+            (_parse_rfc3339(slot['start']), _parse_rfc3339(slot['end'])) for slot in busy_slots
+        )
+        merged: List[List[datetime]] = []
+        for busy_start, busy_end in intervals:
+            if merged and busy_start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], busy_end)
+            else:
+                merged.append([busy_start, busy_end])
 
+        duration = timedelta(minutes=duration_minutes)
         free_slots: List[Dict[str, Any]] = []
         window_start = start_date
-        for slot in busy_slots:
-            start = datetime.fromisoformat(slot['start'])
-            if window_start + timedelta(minutes=duration_minutes) <= start:
-                free_slots.append({'start': window_start.isoformat(), 'end': (window_start + timedelta(minutes=duration_minutes)).isoformat()})
-            window_start = max(window_start, datetime.fromisoformat(slot['end']))
+        for busy_start, busy_end in merged:
+            # Skip slots that end before the window starts
+            if busy_end <= window_start:
+                continue
+            if busy_start - window_start >= duration:
+                free_slots.append({'start': window_start.isoformat(), 'end': (window_start + duration).isoformat()})
+            window_start = max(window_start, busy_end)
         # Check after last busy
-        if window_start + timedelta(minutes=duration_minutes) <= end_date:
-            free_slots.append({'start': window_start.isoformat(), 'end': (window_start + timedelta(minutes=duration_minutes)).isoformat()})
+        if window_start + duration <= end_date:
+            free_slots.append({'start': window_start.isoformat(), 'end': (window_start + duration).isoformat()})
         return free_slots
 
 
 def authenticate_calendar() -> GoogleCalendarClient:
     """Legacy helper to get an authenticated client."""
+    # The constructor already authenticates and builds the service
     client = GoogleCalendarClient()
-    return client if client.authenticate() else None
+    return client if client.service else None
@@ -6,19 +6,56 @@ email retrieval, parsing, and draft creation. It inherits from BaseGoogleClient
 for authentication and shared functionality.
 """
 
-from typing import List, Dict, Any
-from datetime import datetime
+from typing import List, Dict, Any, Literal, Optional, Union
+from datetime import datetime, timezone
+import asyncio
 import base64
-from email.mime.text import MIMEText
-import re
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+from email.utils import getaddresses, parseaddr, parsedate_to_datetime
 
-from backend.google.base_client import BaseGoogleClient
+from backend.google.base_client import BaseGoogleClient, RETRYABLE_STATUSES
 from backend.google.emails import Email
 from googleapiclient.errors import HttpError
 
 # Import unified scopes from base client
 from backend.google.base_client import UNIFIED_SCOPES
 
+# Partial-response field selection for messages.get: only what
+# create_email_from_message reads
+_MESSAGE_FIELDS = "id,threadId,labelIds,snippet,sizeEstimate,internalDate,payload(mimeType,headers,body/data,parts)"
+
+# Same selection for format="metadata" fetches, which carry no body
+_METADATA_FIELDS = "id,threadId,labelIds,snippet,sizeEstimate,internalDate,payload(mimeType,headers)"
+
+# Message formats callers can request: "full" includes the body, "metadata" only headers
+MessageFormat = Literal["metadata", "full"]
+
+# Headers create_email_from_message reads, plus the bulk-mail markers used to spot
+# automated senders; everything else (Received, DKIM, ...) is skipped. The full
+# header list stays available in Email.raw_message
+_WANTED_HDRS = frozenset({
+    "Subject", "From", "Reply-To", "Date", "Message-ID", "To", "Cc", "Bcc",
+    "List-Unsubscribe", "Precedence", "Auto-Submitted",
+})
+
+# The user's own address (from getProfile) per (credentials_path, token_path).
+# It never changes for an account, so new clients reuse it instead of asking again
+_USER_EMAILS: Dict[tuple, str] = {}
+
+# Batch request ID for the getProfile call piggybacked on message fetches
+# (message IDs are hex strings, so this can't collide with one)
+_PROFILE_REQUEST_ID = "profile"
+
+
+def _note_permanent_failures(failed: set):
+    """Batch callback recording the requests that failed for good (e.g. 404) in failed"""
+    def note_failure(request_id, response, exception):
+        if exception is not None and not (isinstance(exception, HttpError) and exception.resp.status in RETRYABLE_STATUSES):
+            failed.add(request_id)
+    return note_failure
+
+
 class GmailClient(BaseGoogleClient):
     """
     Gmail API client for handling email operations.
@@ -37,6 +74,8 @@ class GmailClient(BaseGoogleClient):
         """
         super().__init__(credentials_path, token_path, UNIFIED_SCOPES)
         self.service = None  # Will be built when authenticate() is called
+        # Cached getProfile() address, fetched on first use unless another client already did
+        self._user_email: Optional[str] = _USER_EMAILS.get((credentials_path, token_path))
         self.authenticate()
         
     def authenticate(self) -> bool:
@@ -83,46 +122,90 @@ class GmailClient(BaseGoogleClient):
             print(f"Error getting messages: {error}")
             return []
     
-    def get_unread_emails(self, count: int) -> List[Email]:
-        """Get unread emails"""
+    def get_unread_emails(self, count: int, message_format: MessageFormat = "full") -> List[Email]:
+        """Get unread emails
+        
+        Messages the batch couldn't return because of rate limits or transient
+        errors are fetched again one at a time, so they aren't silently dropped.
+        Args:
+            count(int): Maximum number of unread emails to fetch
+            message_format(str): "full" for complete emails, "metadata" for headers only (no body)
+        """
         if not self.service:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
         try:
-            results = self.service.users().messages().list(
-                userId="me",
-                q="is:unread",
-                maxResults=count
-            ).execute()
-            msgs = results.get("messages", [])
-            emails = []
-            for msg in msgs:
-                # Get full message details using the message ID
-                full_msg = self.service.users().messages().get(
-                    userId="me",
-                    id=msg["id"],
-                    format="full"  # Gets complete message with headers and body
-                ).execute()
-                #extract info from full_msg
-                email = self.create_email_from_message(full_msg)
-                emails.append(email)
-            return emails
+            msgs = self._list_unread(count)
+            failed = set()
+            full_msgs = self.batch_get(self._unread_requests(msgs, message_format), callback=_note_permanent_failures(failed))
+            self._retry_missing([msg["id"] for msg in msgs], full_msgs, failed, message_format)
+            return self._unread_from_batch(msgs, full_msgs)
         except HttpError as error:
             print(f"Error getting unread emails: {error}")
             return []
     
-    def fetch_email_by_msg_id(self, msg_id: str) -> List[Email]:
-        """Fetch a specific email by its message ID"""
+    async def aget_unread_emails(self, count: int, message_format: MessageFormat = "full") -> List[Email]:
+        """Async version of get_unread_emails for use inside an event loop
+        
+        The Gmail calls run in worker threads (batch_get_async), so the event
+        loop keeps serving other work, and fetches of more than 100 messages
+        send their batches concurrently.
+        
+        Args:
+            count(int): Maximum number of unread emails to fetch
+            message_format(str): "full" for complete emails, "metadata" for headers only (no body)
+        """
+        if not self.service:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        
+        try:
+            msgs = await asyncio.to_thread(self._list_unread, count)
+            failed = set()
+            full_msgs = await self.batch_get_async(self._unread_requests(msgs, message_format), callback=_note_permanent_failures(failed))
+            await asyncio.to_thread(self._retry_missing, [msg["id"] for msg in msgs], full_msgs, failed, message_format)
+            return self._unread_from_batch(msgs, full_msgs)
+        except HttpError as error:
+            print(f"Error getting unread emails: {error}")
+            return []
+    
+    def _list_unread(self, count: int) -> List[Dict[str, Any]]:
+        """List the IDs of up to count unread messages, newest first."""
+        results = self.service.users().messages().list(
+            userId="me",
+            q="is:unread",
+            maxResults=count
+        ).execute()
+        return results.get("messages", [])
+    
+    def _unread_requests(self, msgs: List[Dict[str, Any]], message_format: MessageFormat) -> Dict[str, Any]:
+        """Build the batch of messages.get requests for listed messages."""
+        # Get full message details for every ID in batches of up to 100
+        requests = {msg["id"]: self._get_message_request(msg["id"], message_format) for msg in msgs}
+        
+        # Drafts are usually created right after reading unread emails, so fetch the
+        # user's address in the same batch instead of a separate round trip later
+        if self._user_email is None and requests:
+            requests[_PROFILE_REQUEST_ID] = self.service.users().getProfile(userId="me")
+        return requests
+    
+    def _unread_from_batch(self, msgs: List[Dict[str, Any]], full_msgs: Dict[str, Any]) -> List[Email]:
+        """Turn batch responses into Email objects in messages.list order."""
+        profile = full_msgs.pop(_PROFILE_REQUEST_ID, None)
+        if profile:
+            self._user_email = profile["emailAddress"]
+            _USER_EMAILS[(self.credentials_path, self.token_path)] = self._user_email
+        
+        # Keep the order returned by messages.list
+        return [self.create_email_from_message(full_msgs[msg["id"]]) for msg in msgs if msg["id"] in full_msgs]
+    
+    def fetch_email_by_msg_id(self, msg_id: str, message_format: MessageFormat = "full") -> List[Email]:
+        """Fetch a specific email by its message ID ("metadata" format skips the body)"""
         if not self.service:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
         try:
             # Get full message details using the message ID
-            full_msg = self.service.users().messages().get(
-                userId="me",
-                id=msg_id,
-                format="full"  # Gets complete message with headers and body
-            ).execute()
+            full_msg = self._get_message_request(msg_id, message_format).execute()
             
             # Create Email object from the message
             email = self.create_email_from_message(full_msg)
@@ -135,6 +218,63 @@ class GmailClient(BaseGoogleClient):
             print(f"Unexpected error fetching email with ID {msg_id}: {error}")
             return []
             
+    def fetch_emails_by_msg_ids(self, msg_ids: List[str], message_format: MessageFormat = "full") -> Dict[str, Email]:
+        """
+        Fetch several emails by message ID in batched requests.
+        
+        Args:
+            msg_ids (list): Gmail message IDs to fetch
+            message_format (str): "full" for complete emails, "metadata" for headers only
+            
+        Returns:
+            dict: Email objects keyed by message ID (IDs that failed to fetch are left out)
+        """
+        if not self.service:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        
+        failed = set()
+        full_msgs = self.batch_get(
+            {msg_id: self._get_message_request(msg_id, message_format) for msg_id in msg_ids},
+            callback=_note_permanent_failures(failed)
+        )
+        self._retry_missing(msg_ids, full_msgs, failed, message_format)
+        
+        return {msg_id: self.create_email_from_message(full_msgs[msg_id]) for msg_id in msg_ids if msg_id in full_msgs}
+            
+    def _retry_missing(self, msg_ids: List[str], full_msgs: Dict[str, Any], failed: set, message_format: MessageFormat) -> None:
+        """
+        Fetch, one at a time, the messages a batch didn't return.
+        
+        Rate-limited or transient failures, and batches that failed as a whole,
+        are retried with backoff; IDs in failed (see _note_permanent_failures)
+        are skipped. Fetched messages are added to full_msgs.
+        """
+        for msg_id in msg_ids:
+            if msg_id in full_msgs or msg_id in failed:
+                continue
+            try:
+                full_msgs[msg_id] = self._execute_with_retry(self._get_message_request(msg_id, message_format))
+            except HttpError as error:
+                print(f"Error fetching email with ID {msg_id}: {error}")
+    
+    def _get_message_request(self, msg_id: str, message_format: MessageFormat = "full"):
+        """Build (but don't execute) a messages.get request for a message."""
+        if message_format == "metadata":
+            # Only the headers create_email_from_message reads; no body is downloaded
+            return self.service.users().messages().get(
+                userId="me",
+                id=msg_id,
+                format="metadata",
+                metadataHeaders=sorted(_WANTED_HDRS),
+                fields=_METADATA_FIELDS
+            )
+        return self.service.users().messages().get(
+            userId="me",
+            id=msg_id,
+            format="full",  # Gets complete message with headers and body
+            fields=_MESSAGE_FIELDS
+        )
+    
     def mark_as_read(self, msg_id: str) -> bool:
         """Mark an email as read"""
         if not self.service:
@@ -157,6 +297,29 @@ class GmailClient(BaseGoogleClient):
             print(f"Unexpected error marking email as read: {error}")
             return False
         
+    def mark_many_as_read(self, msg_ids: List[str]) -> bool:
+        """Mark several emails as read with a single batchModify call"""
+        if not self.service:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        if not msg_ids:
+            return True
+        
+        try:
+            # batchModify accepts up to 1000 IDs and returns an empty body
+            self._execute_with_retry(
+                self.service.users().messages().batchModify(
+                    userId="me",
+                    body={"ids": list(msg_ids), "removeLabelIds": ["UNREAD"]}
+                )
+            )
+            return True
+        except HttpError as error:
+            print(f"Error marking emails as read: {error}")
+            return False
+        except Exception as error:
+            print(f"Unexpected error marking emails as read: {error}")
+            return False
+        
     def create_email_from_message(self, full_msg: Dict) -> Email:
         """Create an Email object from Gmail API message response"""
         email = Email()
@@ -173,8 +336,8 @@ class GmailClient(BaseGoogleClient):
         payload = full_msg.get("payload", {})
         headers = payload.get("headers", [])
         
-        # Convert headers to dictionary for easy access
-        header_dict = {header["name"]: header["value"] for header in headers}
+        # Convert the headers we use to a dictionary for easy access
+        header_dict = {header["name"]: header["value"] for header in headers if header["name"] in _WANTED_HDRS}
         email.headers = header_dict
         
         # Extract header information
@@ -196,8 +359,9 @@ class GmailClient(BaseGoogleClient):
         email.sent_date = self.parse_date(email.date)
         email.received_date = self.parse_internal_date(email.internal_date)
         
-        # Extract body content
-        email.body_text, email.body_html = self.extract_body_content(payload)
+        # Extract body content (metadata-format messages have none)
+        if payload.get("parts") or payload.get("body", {}).get("data"):
+            email.body_text, email.body_html = self.extract_body_content(payload)
         
         return email
     
@@ -212,62 +376,12 @@ class GmailClient(BaseGoogleClient):
             raise RuntimeError("Not authenticated. Call authenticate() first.")
         
         try:
-            # 1. Build the MIME message
-            message = MIMEText(email.draft, "plain")
-
             # Get all relevant people the email needs to be sent to (reply all)
-            profile = self.service.users().getProfile(userId="me").execute()   
-            user_email = profile['emailAddress']
-            
-
-            # Build recipient lists for reply-all
-            orig_to = email.to or []
-            orig_cc = email.cc or []
-            orig_bcc = email.bcc or []
+            user_email = self._me()
             
-            # Clean up email lists to only contain plain email addresses
-            orig_to = [self.extract_email_only(x) for x in orig_to]
-            orig_cc = [self.extract_email_only(x) for x in orig_cc]
-            orig_bcc = [self.extract_email_only(x) for x in orig_bcc]
-
-            orig_to.append(email.from_address)
-            
-            
-            orig_to = [x for x in orig_to if x != user_email]
-            cc_send = [x for x in orig_cc if x != user_email]
-            bcc_send = [x for x in orig_bcc if x != user_email]
-
-            # Set recipients
-            if orig_to:
-                message["To"] = ', '.join(orig_to)
-            else:
+            create_body = self.build_draft_body(email, user_email)
+            if create_body is None:
                 return "ERROR CREATING DRAFT: No recipients found"
-            if cc_send:
-                message["Cc"] = ", ".join(cc_send)
-            if bcc_send:
-                message["Bcc"] = ", ".join(bcc_send)
-        
-            # Format subject for reply (add "Re:" if not already present)
-            subject = email.subject
-            if not subject.lower().startswith("re:"):
-                subject = f"Re: {subject}"
-            message["Subject"] = subject
-
-            # Set reply headers for proper threading
-            if email.message_id:
-                message["In-Reply-To"] = email.message_id
-                message["References"] = email.message_id
-
-            # 2. Base64-encode the message
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
-
-            # 3. Wrap it in the request body with thread ID for conversation threading
-            create_body = {
-                "message": {
-                    "raw": raw_message,
-                    "threadId": email.thread_id
-                }
-            }
 
             draft = (
                 self.service.users()
@@ -284,63 +398,191 @@ class GmailClient(BaseGoogleClient):
             print(f"Unexpected error creating draft: {error}")
             return False
 
-    def edit_existing_draft(self, draft_id: str, new_body: str, new_subject: str, new_to: list[str], new_cc: list[str], new_bcc: list[str]) -> str:
-        """Edit an existing draft by its draft ID"""
+    def create_drafts_from_emails(self, emails: List[Email]) -> Dict[str, Any]:
+        """Create drafts for several Email objects in batched requests
+        Args:
+            emails(list[Email]): Email objects that contain the drafts to be created
+        Returns:
+            dict: For each email id, the created draft id, an error string if the email has
+                no recipients, or False if the request failed (as in create_draft_from_email)
+        """
         if not self.service:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
-
+        
         try:
-            # Get the draft information from draft id from API
-            try:
-                draft = self.service.users().drafts().get(userId='me', id=draft_id, format='full').execute()
-            except HttpError as e:
-                return "Error editing draft: Draft not found or access denied"
-            except Exception as e:
-                return "Error editing draft: Network or API error"
-            
-            draft_obj = self.create_email_from_message(draft['message'])
-
-            draft_message = ""
-            
-            if new_body:
-                draft_message = MIMEText(new_body, "plain")
+            # Needed to leave the user out of the reply-all recipients
+            user_email = self._me()
+        except HttpError as error:
+            print(f"Error creating drafts: {error}")
+            return {email.id: False for email in emails}
+        
+        draft_ids: Dict[str, Any] = {}
+        requests = {}
+        for email in emails:
+            create_body = self.build_draft_body(email, user_email)
+            if create_body is None:
+                draft_ids[email.id] = "ERROR CREATING DRAFT: No recipients found"
             else:
-                draft_message = MIMEText(draft_obj.body_text, "plain")
+                requests[email.id] = self.service.users().drafts().create(userId='me', body=create_body)
+        
+        created = self.batch_get(requests)
+        for email_id in requests:
+            draft_ids[email_id] = created[email_id]['id'] if email_id in created else False
+        return draft_ids
+
+    def _me(self) -> str:
+        """Return the authenticated user's email address, fetching it once per account"""
+        if self._user_email is None:
+            self._user_email = self._execute_with_retry(self.service.users().getProfile(userId="me"))["emailAddress"]
+            _USER_EMAILS[(self.credentials_path, self.token_path)] = self._user_email
+        return self._user_email
+
+    def build_draft_body(self, email: Email, user_email: str) -> Optional[Dict[str, Any]]:
+        """Build the drafts.create request body for a reply-all to an email
+        Args:
+            email(Email): An Email object that contains the draft to be created
+            user_email(str): The user's own address, left out of the recipients
+        Returns:
+            dict: The request body, or None if there are no recipients
+        """
+        # 1. Build the MIME message
+        message = EmailMessage()
+        message.set_content(email.draft)
+
+        # Build recipient lists for reply-all: one getaddresses pass per list reduces
+        # each entry to its plain address and the filter drops the user's own
+        def recipients(entries):
+            return [addr for _, addr in getaddresses(entries) if addr and addr != user_email]
+
+        orig_to = recipients([*(email.to or []), email.from_address])
+        cc_send = recipients(email.cc or [])
+        bcc_send = recipients(email.bcc or [])
+
+        # Set recipients
+        if orig_to:
+            message["To"] = ', '.join(orig_to)
+        else:
+            return None
+        if cc_send:
+            message["Cc"] = ", ".join(cc_send)
+        if bcc_send:
+            message["Bcc"] = ", ".join(bcc_send)
+    
+        # Format subject for reply (add "Re:" if not already present)
+        subject = email.subject
+        if not subject.lower().startswith("re:"):
+            subject = f"Re: {subject}"
+        message["Subject"] = subject
+
+        # Set reply headers for proper threading
+        if email.message_id:
+            message["In-Reply-To"] = email.message_id
+            message["References"] = email.message_id
+
+        # 2. Base64-encode the message
+        raw_message = base64.urlsafe_b64encode(bytes(message)).decode()
+
+        # 3. Wrap it in the request body with thread ID for conversation threading
+        return {
+            "message": {
+                "raw": raw_message,
+                "threadId": email.thread_id
+            }
+        }
 
-            if new_subject:
-                draft_message["Subject"] = new_subject
-            else:
-                draft_message["Subject"] = draft_obj.subject
+    def edit_existing_draft(self, draft_id: str, new_body: Optional[str], new_subject: Optional[str], new_to: Optional[list[str]], new_cc: Optional[list[str]], new_bcc: Optional[list[str]], thread_id: Optional[str] = None) -> str:
+        """Edit an existing draft by its draft ID
+        Args:
+            draft_id(str): The draft to edit
+            new_body, new_subject, new_to, new_cc, new_bcc: New values. None keeps the draft's
+                current value; an empty string or list replaces it with an empty one
+            thread_id(str): The draft's thread ID, used if the draft doesn't report one
+        Returns:
+            str: The draft id of the updated draft, or an error message
+        """
+        if not self.service:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
 
-            if new_to:
-                draft_message["To"] = ", ".join(new_to)
-            else:
-                draft_message["To"] = ", ".join(draft_obj.to)
+        try:
+            # Nothing to change, so there's nothing to fetch or update
+            if new_body is None and new_subject is None and new_to is None and new_cc is None and new_bcc is None:
+                return draft_id
+
+            new_headers = {
+                "Subject": new_subject,
+                "To": None if new_to is None else ", ".join(new_to),
+                "Cc": None if new_cc is None else ", ".join(new_cc),
+                "Bcc": None if new_bcc is None else ", ".join(new_bcc),
+            }
 
-            if new_cc:
-                draft_message["Cc"] = ", ".join(new_cc)
+            if new_body is None:
+                # Body unchanged: fetch the draft's raw MIME message and swap only the
+                # changed headers, instead of decoding the body into a new message.
+                # Threading headers (In-Reply-To, References) are kept as they are
+                try:
+                    draft = self.service.users().drafts().get(userId='me', id=draft_id, format='raw').execute()
+                except HttpError as e:
+                    return "Error editing draft: Draft not found or access denied"
+                except Exception as e:
+                    return "Error editing draft: Network or API error"
+
+                raw = draft['message']['raw']
+                draft_message = message_from_bytes(base64.urlsafe_b64decode(raw + "=" * (-len(raw) & 3)), policy=policy.default)
+                thread_id = draft['message'].get('threadId', thread_id)
+
+                for name, value in new_headers.items():
+                    if value is not None:
+                        del draft_message[name]  # Removes the existing header, if any
+                        if value:
+                            draft_message[name] = value
             else:
-                draft_message["Cc"] = ", ".join(draft_obj.cc)
+                # The new body replaces the old one, so headers are all that's needed from
+                # the existing draft: current values for fields that aren't being replaced,
+                # the thread ID, and the threading headers
+                try:
+                    draft = self.service.users().drafts().get(userId='me', id=draft_id, format='metadata').execute()
+                except HttpError as e:
+                    return "Error editing draft: Draft not found or access denied"
+                except Exception as e:
+                    return "Error editing draft: Network or API error"
+
+                draft_obj = self.create_email_from_message(draft['message'])
+                thread_id = draft_obj.thread_id or thread_id
+                raw_headers = {
+                    header.get("name", "").lower(): header.get("value", "")
+                    for header in draft['message'].get('payload', {}).get('headers', [])
+                }
 
-            if new_bcc:
-                draft_message["Bcc"] = ", ".join(new_bcc)
-            else:
-                draft_message["Bcc"] = ", ".join(draft_obj.bcc)
+                draft_message = EmailMessage()
+                draft_message.set_content(new_body)
+
+                # Fall back to the draft's current values for anything not replaced
+                current_headers = {
+                    "Subject": draft_obj.subject,
+                    "To": ", ".join(draft_obj.to),
+                    "Cc": ", ".join(draft_obj.cc),
+                    "Bcc": ", ".join(draft_obj.bcc),
+                }
+                for name, value in new_headers.items():
+                    value = current_headers[name] if value is None else value
+                    if value or name == "Subject":
+                        draft_message[name] = value
 
-            # Set reply headers for proper threading
-            if draft_obj.message_id:
-                draft_message["In-Reply-To"] = draft_obj.message_id
-                draft_message["References"] = draft_obj.message_id
+                # Keep the reply headers for proper threading
+                in_reply_to = raw_headers.get("in-reply-to") or draft_obj.message_id
+                if in_reply_to:
+                    draft_message["In-Reply-To"] = in_reply_to
+                    draft_message["References"] = raw_headers.get("references") or in_reply_to
 
             # 2. Base64-encode the message
-            raw_message = base64.urlsafe_b64encode(draft_message.as_bytes()).decode()
+            raw_message = base64.urlsafe_b64encode(bytes(draft_message)).decode()
 
             # 3. Wrap it in the request body with thread ID for conversation threading
             create_body = {
                 'id': draft_id,
                 "message": {
                     "raw": raw_message,
-                    "threadId": draft_obj.thread_id
+                    "threadId": thread_id
                 }
             }
 
@@ -360,6 +602,26 @@ class GmailClient(BaseGoogleClient):
             print(f"Unexpected error editing draft: {error}")
             return "Unexpected error editing draft"
 
+    def get_user_profile(self) -> Dict[str, str]:
+        """Get the user's address, display name and signature from their primary send-as identity"""
+        if not self.service:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        
+        try:
+            send_as = self.service.users().settings().sendAs().list(userId="me").execute().get("sendAs", [])
+            primary = next((identity for identity in send_as if identity.get("isPrimary")), {})
+            return {
+                "email": primary.get("sendAsEmail") or self._me(),
+                "name": primary.get("displayName", ""),
+                "signature": primary.get("signature", ""),  # HTML signature
+            }
+        except HttpError as error:
+            print(f"Error getting user profile: {error}")
+            return {}
+        except Exception as error:
+            print(f"Unexpected error getting user profile: {error}")
+            return {}
+
     def send_draft(self, draft_id: str) -> bool:
         """Send a draft by its message ID"""
         if not self.service:
@@ -381,46 +643,55 @@ class GmailClient(BaseGoogleClient):
             print(f"Unexpected error sending draft: {e}")
             return False
 
+    def send_drafts(self, draft_ids: List[str]) -> Dict[str, bool]:
+        """Send several drafts in batched requests
+        Args:
+            draft_ids(list[str]): Draft ids to send
+        Returns:
+            dict: For each draft id, True if it was sent, False if not
+        """
+        if not self.service:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+        
+        sent = self.batch_get({
+            draft_id: self.service.users().drafts().send(userId='me', body={'id': draft_id})
+            for draft_id in draft_ids
+        })
+        return {draft_id: draft_id in sent for draft_id in draft_ids}
+
     def extract_email_only(self, email_str):
         """Extract just the email address from formatted strings like 'Name <email@domain.com>'"""
-
-        # Pattern to match email in angle brackets
-        match = re.search(r'<(.+@.+)>', email_str)
-        if match:
-            return match.group(1)
-        # If no angle brackets, return as is
-        return email_str
+        # If the string can't be parsed as an address, return as is
+        return parseaddr(email_str)[1] or email_str
 
     def parse_email_address(self, email_string: str) -> tuple[str, str]:
         """Parse 'Name <email@domain.com>' format into name and address"""
-        import re
-        
         if not email_string:
             return "", ""
         
-        # Pattern to match "Name <email@domain.com>" or just "email@domain.com"
-        match = re.match(r'^(.*?)\s*<(.+@.+)>$', email_string.strip())
-        if match:
-            name = match.group(1).strip(' "')
-            address = match.group(2).strip()
-            return name, address
-        else:
-            # Just an email address without name
-            return "", email_string.strip()
+        # Match "Name <email@domain.com>" or just "email@domain.com" with plain string
+        # scans: the address is between the first '<' and a trailing '>'
+        email_string = email_string.strip()
+        start = email_string.find("<")
+        if start != -1 and email_string.endswith(">"):
+            address = email_string[start + 1:-1]
+            if "@" in address[1:-1]:
+                name = email_string[:start].rstrip().strip(' "')
+                return name, address.strip()
+        
+        # Just an email address without name
+        return "", email_string
 
     def parse_email_list(self, email_string: str) -> List[str]:
-        """Parse comma-separated email list"""
+        """Parse an RFC 5322 address list into plain email addresses"""
         if not email_string:
             return []
         
-        # Split by comma and clean up each email
-        emails = [email.strip() for email in email_string.split(',')]
-        return [email for email in emails if email]  # Remove empty strings
+        # getaddresses respects quoted display names such as "Doe, John" <j@x.com>
+        return [addr for _, addr in getaddresses([email_string]) if addr]
 
     def parse_date(self, date_string: str) -> datetime:
         """Parse RFC 2822 date string to datetime object"""
-        from email.utils import parsedate_to_datetime
-        
         if not date_string:
             return None
         
@@ -435,66 +706,60 @@ class GmailClient(BaseGoogleClient):
             return None
         
         try:
-            # Convert milliseconds to seconds
+            # Convert milliseconds to seconds. Building the datetime in UTC avoids a
+            # localtime() lookup per message; convert to local time when displaying
             timestamp = int(internal_date) / 1000
-            return datetime.fromtimestamp(timestamp)
+            return datetime.fromtimestamp(timestamp, tz=timezone.utc)
         except (ValueError, TypeError):
             return None
 
     def extract_body_content(self, payload: Dict) -> tuple[str, str]:
         """Extract both text and HTML body content"""
-        text_body = ""
-        html_body = ""
+        text_parts = []
+        html_parts = []
         
-        def process_part(part):
-            nonlocal text_body, html_body
+        # Walk the MIME tree depth-first with an explicit stack. Children are pushed in
+        # reverse so parts pop (and are joined) in their original document order
+        stack = list(reversed(payload["parts"])) if "parts" in payload else [payload]
+        while stack:
+            part = stack.pop()
             mime_type = part.get("mimeType", "")
             
             if mime_type == "text/plain":
                 data = part.get("body", {}).get("data", "")
                 if data:
-                    text_body += self.decode_base64(data)
+                    text_parts.append(self.decode_base64(data))
                     
             elif mime_type == "text/html":
                 data = part.get("body", {}).get("data", "")
                 if data:
-                    html_body += self.decode_base64(data)
+                    html_parts.append(self.decode_base64(data))
                     
             elif mime_type.startswith("multipart/"):
                 # Process nested parts
-                for sub_part in part.get("parts", []):
-                    process_part(sub_part)
+                stack.extend(reversed(part.get("parts", [])))
         
-        # Handle multipart vs single part messages
-        if "parts" in payload:
-            for part in payload["parts"]:
-                process_part(part)
-        else:
-            process_part(payload)
-        
-        return text_body.strip(), html_body.strip()
+        return "".join(text_parts).strip(), "".join(html_parts).strip()
 
-    def decode_base64(self, data: str) -> str:
-        """Decode base64url encoded data"""
-        import base64
-        
+    def decode_base64(self, data: Union[str, bytes]) -> str:
+        """Decode base64url encoded data (str from the JSON API, or bytes)"""
         try:
-            # Add padding if needed
-            missing_padding = len(data) % 4
-            if missing_padding:
-                data += '=' * (4 - missing_padding)
-            
-            # Replace URL-safe characters and decode
-            data = data.replace('-', '+').replace('_', '/')
-            return base64.b64decode(data).decode('utf-8', errors='ignore')
+            # Convert to bytes once; everything up to the final decode stays in bytes
+            raw = data.encode('ascii', 'ignore') if isinstance(data, str) else data
+            # Pad to a multiple of 4; urlsafe_b64decode handles '-' and '_' itself
+            pad = -len(raw) & 3
+            if pad:
+                raw += b'=' * pad
+            return base64.urlsafe_b64decode(raw).decode('utf-8', errors='ignore')
         except Exception:
             return ""
 
 
 def authenticate_gmail() -> GmailClient:
     """Legacy function for backward compatibility"""
+    # The constructor already authenticates and builds the service
     client = GmailClient()
-    if client.authenticate():
+    if client.service:
         return client
     return None
 
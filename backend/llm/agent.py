@@ -6,20 +6,46 @@ React agent pattern, which enables the agent to use tools and maintain
 conversation state across interactions.
 """
 
-from backend.llm.init_llm import claude
-from backend.llm.tools import TOOLS
-from backend.llm.prompts import test_react_agent_main_prompt
-from langgraph.prebuilt import create_react_agent
-from langgraph.checkpoint.memory import MemorySaver
+from functools import lru_cache
 
 
-# Create the main AI agent using LangGraph's React agent pattern
-# This agent can use tools, maintain conversation state, and handle complex workflows
-agent = create_react_agent(
-    model=claude,                    # The LLM model (Claude 3.7 Sonnet)
-    tools=TOOLS,                     # Available tools for the agent to use
-    prompt=test_react_agent_main_prompt,  # System prompt defining agent behavior
-    checkpointer=MemorySaver(),      # Memory system for maintaining conversation state
-)
+@lru_cache(maxsize=1)
+def get_agent():
+    """
+    Return the main AI agent, building it on first use.
+    
+    LangGraph, the Claude model, the tools and the prompts are imported here,
+    so importing this module doesn't pay their start-up cost.
+    
+    Returns:
+        The compiled LangGraph React agent
+    """
+    from backend.llm.init_llm import get_claude
+    from backend.llm.tools import TOOLS, ASYNC_TOOLS
+    from backend.llm.prompts import get_agent_system_prompt
+    from langchain_core.messages import SystemMessage
+    from langchain_core.tools import StructuredTool
+    from langgraph.prebuilt import create_react_agent
+    from langgraph.checkpoint.memory import MemorySaver
 
+    # Tools with an async version get both, so ainvoke awaits the coroutine
+    tools = [
+        StructuredTool.from_function(func=tool, coroutine=ASYNC_TOOLS[tool]) if tool in ASYNC_TOOLS else tool
+        for tool in TOOLS
+    ]
 
+    # Create the main AI agent using LangGraph's React agent pattern
+    # This agent can use tools, maintain conversation state, and handle complex workflows
+    return create_react_agent(
+        model=get_claude(),              # The LLM model (Claude 3.7 Sonnet)
+        tools=tools,                     # Available tools for the agent to use
+        prompt=SystemMessage(content=get_agent_system_prompt()),  # System prompt defining agent behavior (prompt-cached)
+        checkpointer=MemorySaver(),      # Memory system for maintaining conversation state
+    )
+
+
+def __getattr__(name: str):
+    """Expose the shared agent as ``agent`` for existing imports (PEP 562)."""
+    if name == "agent":
+        return get_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,131 @@
 """
 LLM initialization module for the Agentic Assistant.
 
-This module initializes and configures the Claude 3.7 Sonnet model
-from Anthropic using the API key from environment settings.
+This module initializes and configures the Claude 3.7 Sonnet model (and
+Claude 3.5 Haiku for lightweight steps) from Anthropic using the API key
+from environment settings.
 """
 
-from langchain_anthropic import ChatAnthropic
-from backend.config.settings import settings
+from functools import lru_cache
 
-# Initialize the Claude 3.7 Sonnet model with API key from settings
-# This model will be used by the agent for all LLM operations
-claude = ChatAnthropic(
-    model="claude-3-7-sonnet-20250219",  # Specific model version for consistency
-    api_key=settings.ANTHROPIC_API_KEY,  # API key loaded from environment variables
-)
\ No newline at end of file
+# Maximum number of prompt/response pairs kept in the in-memory LLM cache
+LLM_CACHE_SIZE = 256
+
+# Seconds to wait for an Anthropic response, and how often to retry a failed call.
+# langchain-anthropic reuses one httpx client per (base URL, timeout), so with the
+# same timeout every model below sends its requests over one keep-alive pool
+LLM_TIMEOUT = 60
+LLM_MAX_RETRIES = 2
+
+
+@lru_cache(maxsize=1)
+def get_claude():
+    """
+    Return the process-wide Claude model, creating it on first use.
+    
+    The Anthropic SDK is imported here rather than at module import, so
+    importing this module stays cheap until the model is actually needed.
+    Every caller shares this instance. Its HTTP connections come from the
+    httpx pool shared by all the models here (see LLM_TIMEOUT) and stay open
+    across calls.
+    
+    This is the agent's model, so it has no response cache: replaying a
+    cached reply for the same conversation state would repeat (or skip)
+    tool calls without the model deciding to.
+    
+    Returns:
+        ChatAnthropic: The shared Claude 3.7 Sonnet chat model
+    """
+    from langchain_anthropic import ChatAnthropic
+    from backend.config.settings import settings
+
+    # Initialize the Claude 3.7 Sonnet model with API key from settings
+    # This model will be used by the agent for all LLM operations
+    return ChatAnthropic(
+        model="claude-3-7-sonnet-20250219",  # Specific model version for consistency
+        api_key=settings.ANTHROPIC_API_KEY,  # API key loaded from environment variables
+        timeout=LLM_TIMEOUT,
+        max_retries=LLM_MAX_RETRIES,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_drafting_claude():
+    """
+    Return the process-wide Claude 3.7 Sonnet model used by the drafting tools.
+    
+    Same model as get_claude(), but with a response cache: drafting prompts
+    are self-contained, so an identical prompt (e.g. re-drafting a reply to
+    the same email) is answered from the cache instead of another API call.
+    
+    Returns:
+        ChatAnthropic: The shared, cached Claude 3.7 Sonnet chat model
+    """
+    from langchain_anthropic import ChatAnthropic
+    from backend.config.settings import settings
+
+    return ChatAnthropic(
+        model="claude-3-7-sonnet-20250219",
+        api_key=settings.ANTHROPIC_API_KEY,
+        cache=_get_llm_cache(),
+        timeout=LLM_TIMEOUT,
+        max_retries=LLM_MAX_RETRIES,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_claude_haiku():
+    """
+    Return the process-wide Claude 3.5 Haiku model, creating it on first use.
+    
+    Used for simple structured steps (e.g. choosing which emails need a reply)
+    where a smaller model is faster and cheaper than get_claude().
+    
+    Returns:
+        ChatAnthropic: The shared Claude 3.5 Haiku chat model
+    """
+    from langchain_anthropic import ChatAnthropic
+    from backend.config.settings import settings
+
+    return ChatAnthropic(
+        model="claude-3-5-haiku-20241022",
+        api_key=settings.ANTHROPIC_API_KEY,
+        cache=_get_llm_cache(),
+        timeout=LLM_TIMEOUT,
+        max_retries=LLM_MAX_RETRIES,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_llm_cache():
+    """
+    Return the process-wide LLM response cache shared by the tool models.
+    
+    With LLM_CACHE_PATH set, responses are stored in that SQLite file and
+    reused across runs (requires langchain-community); otherwise they're
+    kept in memory for the life of the process. Entries are keyed by prompt
+    and model settings, so the models sharing it don't collide. Never
+    attached to the agent's model (see get_claude).
+    
+    Returns:
+        BaseCache: The cache to attach to the model
+    """
+    from backend.config.settings import settings
+
+    path = settings.LLM_CACHE_PATH
+    if path:
+        try:
+            from langchain_community.cache import SQLiteCache
+            return SQLiteCache(database_path=path)
+        except ImportError:
+            print("langchain-community is not installed; caching LLM responses in memory only")
+
+    from langchain_core.caches import InMemoryCache
+    return InMemoryCache(maxsize=LLM_CACHE_SIZE)
+
+
+def __getattr__(name: str):
+    """Expose the shared model as ``claude`` for existing imports (PEP 562)."""
+    if name == "claude":
+        return get_claude()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,12 +11,21 @@ test_react_agent_main_prompt = """
     You are a helpful assistant that can help the user with their email. 
     
     Use the tools:
-        - get_unread_emails(count: int) -> dict to get unread emails from the user's inbox
-        - create_drafts_for_unread_emails(email_ids: list[str]) -> dict to create drafts for unread emails and send them to the user's drafts folder
+        - get_unread_emails(count: int) -> dict to get unread emails from the user's inbox. If the user doesn't say how many, get 10
+        - create_drafts_for_unread_emails(email_info_dict: dict[str, str]) -> dict to create drafts for unread emails and send them to the user's drafts folder
+            - Only use it if the user has unread emails; it decides itself which emails need a response
+            - Map each message id from get_unread_emails to any information the draft needs (a meeting being set up, user details, etc.), or an empty string
             - After using this tool, tell the user what drafts were created in the following format:
                 - Use a numbered list
                 - Each draft must show the subject, to, cc, bcc, date, and draft content
                 - You will also get a dict with the information about the emails that it created drafts for along with their drafts. Changed the ['ready_to_send'] to True IF AND ONLY IF the user has given send confirmation about that individual draft
+        - send_drafts(draft_ids: list[str], confirmation: bool) -> dict to send drafts created by create_drafts_for_unread_emails
+            - First confirm with the user that they want to send and which drafts; pass the draft_id values of only those drafts
+            - Report which drafts were sent successfully and which were not, and mark the sent drafts' 'status' as 'sent'
+        - edit_existing_draft(...) -> dict to edit a draft, only when the user asks to edit a particular draft created by create_drafts_for_unread_emails
+            - Update that draft's entry in the drafts dict with the new values it returns
+        - get_calendar_events(days: int, fields: list[str]) -> dict when the user asks about their calendar or a reply needs the user's availability
+            - Set days to cover the dates in question
                 
     Answer other questions with the information you have.
     Maintain a professional and friendly tone.
@@ -24,23 +33,15 @@ test_react_agent_main_prompt = """
 
     """
 
-def get_drating_agent_prompt(email_info: str) -> str:
-    """
-    Generate a prompt for creating professional email drafts.
-    
-    This prompt instructs the LLM to create high-quality, professional email drafts
-    that sound like they were written by a thoughtful human colleague. The prompt
-    includes detailed guidelines for tone, structure, and content.
-    
-    Args:
-        email_info (str): String representation of the email data to respond to
-        
-    Returns:
-        str: Complete prompt for email draft generation
-    """
-    return f"""
+# Prompt caching marker: Anthropic caches the prompt prefix up to and including a
+# block marked with it, so repeated calls reuse it. The prefix must be at least
+# 1024 tokens for Sonnet (2048 for Haiku); shorter prefixes are never cached
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Static guidelines for the drafting prompt, built once at import
+DRAFTING_GUIDELINES = """
     You are an AI assistant whose sole responsibility is to compose friendly, professional, and grammatically flawless email drafts that read as though written by a thoughtful human colleague. 
-    You will be given an email as a python dictionary to respond to. Create a draft in response to that email. These are emails that are being sent to the user. Respond as if you are the user.
+    You will be given an email as a JSON object to respond to. Create a draft in response to that email. These are emails that are being sent to the user. Respond as if you are the user.
     
     IMPORTANT: You should only return the draft and nothing else. Do not include any other text or commentary.
     Every draft you produce should:
@@ -76,31 +77,27 @@ def get_drating_agent_prompt(email_info: str) -> str:
     • Do not mention internal reasoning or the guidelines above.  
     • Keep the draft ready for direct copy–paste into an email client.
 
-    <begin_email_info>
-    {email_info}
-    </end_email_info>
-    """
+"""
 
-def get_msg_ids_prompt(email_info: str) -> str:
-    """
-    Generate a prompt for analyzing emails and determining which ones need responses.
-    
-    This prompt instructs the LLM to analyze a list of emails and return only the
-    message IDs of emails that require a response, filtering out spam, automated
-    messages, and non-actionable content.
-    
-    Args:
-        email_info (str): String representation of the email dictionary to analyze
-        
-    Returns:
-        str: Complete prompt for email analysis
-    """
-    # Base prompt that defines the task and criteria
-    prompt = """
-        You are an AI assistant whose only goal is to analyze the provided list of emails and return a Python list of the Gmail message IDs for emails that require a response.
-        Make sure you ONLY RETURN THE PYTHON LIST OF MESSAGE IDs and nothing else.
+# Output format for drafting several emails in one request. Sent after
+# DRAFTING_GUIDELINES, so it takes precedence over the single-draft output rules
+DRAFTING_BATCH_FORMAT = """
+    You will be given a JSON array of emails instead of a single email. Each entry has an "id" and an "email_info" object describing the email to respond to.
+    Write one draft per entry, applying every guideline above to each draft independently.
+
+    You will also be given the user's profile as a JSON object with their "name" and "signature". Sign each draft with the user's name and end it with the signature when it isn't empty; never invent a name or title.
+
+    IMPORTANT: Return ONLY a JSON object mapping each id to its draft (the email body as a string), with no markdown fences, prose, or commentary.
+    For example:
+    {"1978f372d56e4c6b": "Hi Jamie,\\n\\nThank you for...", "1978f372d56e4c6c": "Dear Dr. Patel,\\n\\n..."}
+"""
+
+# Static instructions for choosing which emails need a reply
+MSG_IDS_GUIDELINES = """
+        You are an AI assistant whose only goal is to analyze the provided list of emails and select the Gmail message IDs of emails that require a response.
+        Report your selection by calling the select_reply_ids tool with those IDs (an empty list if no email needs a response).
         For example:
-        ['1978f372d56e4c6b', '1978f372d56e4c6c', '1978f372d56e4c6d']
+        select_reply_ids(ids=['1978f372d56e4c6b', '1978f372d56e4c6c', '1978f372d56e4c6d'])
 
         Criteria for emails needing a response:
         - Sender is different from the receiver (exclude any message you sent to yourself).
@@ -115,38 +112,93 @@ def get_msg_ids_prompt(email_info: str) -> str:
         - Are calendar invites or notifications that only require clicking "Accept/Decline" without a textual reply.
         - Contain no actionable content or questions.
 
-        You will receive a Python variable called `emails_dict`, which is a dict mapping Gmail message IDs to email metadata dictionaries. 
+        You will receive `emails_dict` as a JSON object mapping Gmail message IDs to email summaries (the snippet is the start of the body). 
         
         For example:
-        emails_dict = {{
-            '1978f372d56e4c6b': {{
-                'subject': 'Security alert',
-                'from_email': 'Google no-reply@accounts.google.com',
-                'from_name': 'Google',
-                'from_address': 'no-reply@accounts.google.com',
-                'to': ['test.doshi.email@gmail.com'],
-                'cc': [],
-                'bcc': [],
-                'reply_to': '',
-                'date': 'Fri, 20 Jun 2025 21:20:37 GMT',
-                'received_date': datetime.datetime(2025, 6, 20, 14, 20, 37),
-                'body_text': 'You allowed agent-app access to some of your Google Account data…',
-                'headers': {{ 'Delivered-To': 'test.doshi.email@gmail.com' }},
-                'draft': '',
-                'draft_specications': ''
-            }},
-            # additional entries…
-        }}
+        {
+            "1978f372d56e4c6b": {
+                "draft_specications": "",
+                "from_address": "no-reply@accounts.google.com",
+                "from_name": "Google",
+                "snippet": "You allowed agent-app access to some of your Google Account data…",
+                "subject": "Security alert",
+                "to": ["test.doshi.email@gmail.com"]
+            },
+            ...additional entries
+        }
 
         Please include the draft_specications in the draft that you are creating. This field may include specifications about meeting time, user information, etc.
         """
+
+# Delimiters wrapped around the per-call email data. Concatenating them with the
+# data avoids formatting a template string on every call
+_USER_PROFILE_OPEN = "\n    <begin_user_profile>\n    "
+_USER_PROFILE_CLOSE = "\n    </end_user_profile>\n    "
+_EMAILS_OPEN = "\n    <begin_emails>\n    "
+_EMAILS_CLOSE = "\n    </end_emails>\n    "
+_EMAILS_DICT_OPEN = "\n        <begin_emails_dict>\n        "
+_EMAILS_DICT_CLOSE = "\n        </end_emails_dict>\n        "
+
+def get_agent_system_prompt() -> list[dict]:
+    """
+    Generate the agent's system prompt as a cached content block.
     
-    # Add the actual email data to the prompt
-    part_two = f"""
-        <begin_emails_dict>
-        {email_info}
-        </end_emails_dict>
-        """
+    Anthropic puts the tool definitions ahead of the system prompt, so the
+    cached prefix is every tool schema plus test_react_agent_main_prompt,
+    roughly 1300 tokens and above Sonnet's 1024-token minimum. The agent
+    resends that prefix on every model step of every turn.
+    
+    Returns:
+        list: System message content blocks
+    """
+    return [{"type": "text", "text": test_react_agent_main_prompt, "cache_control": _CACHE_CONTROL}]
+
+def get_batch_drafting_prompt(emails_json: str, user_profile_json: str) -> list[dict]:
+    """
+    Generate a prompt for drafting replies to several emails in one request.
+    
+    Sends DRAFTING_GUIDELINES followed by DRAFTING_BATCH_FORMAT, which asks
+    for a JSON object of drafts keyed by email id. Not marked for prompt
+    caching: the static part is roughly 800 tokens, below Sonnet's
+    1024-token minimum for a cached prefix.
+    
+    Args:
+        emails_json (str): JSON array of {"id": ..., "email_info": ...} entries
+        user_profile_json (str): JSON object with the user's "name" and plain-text "signature"
+        
+    Returns:
+        list: Message content blocks: the guidelines and format, then the user's profile and the emails
+    """
+    return [
+        {"type": "text", "text": DRAFTING_GUIDELINES},
+        {"type": "text", "text": DRAFTING_BATCH_FORMAT},
+        {"type": "text", "text": _USER_PROFILE_OPEN + user_profile_json + _USER_PROFILE_CLOSE},
+        {"type": "text", "text": _EMAILS_OPEN + emails_json + _EMAILS_CLOSE},
+    ]
+
+def get_msg_ids_system_prompt() -> list[dict]:
+    """
+    Generate the system prompt for determining which emails need responses.
+    
+    The criteria for filtering out spam, automated messages, and non-actionable
+    content are static, so this is the same on every call; the emails to
+    analyze go in the user message (see get_msg_ids_user_payload). Not marked
+    for prompt caching: at roughly 550 tokens it is well below Haiku's
+    2048-token minimum for a cached prefix.
+    
+    Returns:
+        list: System message content blocks
+    """
+    return [{"type": "text", "text": MSG_IDS_GUIDELINES}]
+
+def get_msg_ids_user_payload(email_info: str) -> str:
+    """
+    Wrap the emails to analyze for the user message of the msg-ids request.
     
-    # Combine the base prompt with the email data
-    return prompt + part_two
+    Args:
+        email_info (str): String representation of the email dictionary to analyze
+        
+    Returns:
+        str: The delimited email data
+    """
+    return _EMAILS_DICT_OPEN + email_info + _EMAILS_DICT_CLOSE
@@ -1,14 +1,233 @@
 from backend.google.gmail_client import GmailClient
 from backend.google.emails import Email
-from backend.google.gcal_client import GoogleCalendarClient
-from backend.google.events import Event
-from backend.pipelines.chat import chat_with_agent, create_chat_id
 from backend.llm import init_llm
 from backend.llm import prompts
-from backend.google.gmail_client import GmailClient
 
-import ast
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import html
+import json
+from operator import attrgetter
+import re
+import threading
+import time
+
+import orjson
+
+# Maximum concurrent Gmail requests issued from a tool call
+MAX_GMAIL_WORKERS = 16
+
+# Emails drafted per streamed LLM request, and how many of those requests run at once
+DRAFTS_PER_REQUEST = 5
+MAX_LLM_WORKERS = 4
+
+# Emails fetched by get_unread_emails, reused by create_drafts_for_unread_emails
+# instead of fetching them again. Bounded LRU with a time-to-live
+EMAIL_CACHE_SIZE = 512
+EMAIL_CACHE_TTL = 300  # seconds
+_email_cache: "OrderedDict[str, tuple[float, Email]]" = OrderedDict()
+_email_cache_lock = threading.Lock()
+
+# Results of get_unread_emails by (token_path, count), i.e. per account, reused for
+# back-to-back calls. Cleared by tools that change the mailbox (marking emails read,
+# sending drafts)
+UNREAD_CACHE_TTL = 30  # seconds
+_unread_cache: dict[tuple[str, int], tuple[float, dict]] = {}
+_unread_cache_lock = threading.Lock()
+
+# Drafts already written, keyed by the email's content (see _draft_cache_key), so the
+# same email seen again (e.g. drafting is re-run on the same unread mail) reuses its
+# draft instead of another LLM call. Bounded LRU with a time-to-live, like the email cache
+DRAFT_CACHE_SIZE = 256
+DRAFT_CACHE_TTL = 3600  # seconds
+_draft_cache: "OrderedDict[tuple, tuple[float, str]]" = OrderedDict()
+_draft_cache_lock = threading.Lock()
+
+# Characters of body text shown to the LLM when choosing which emails need a reply
+SELECTION_SNIPPET_CHARS = 400
+
+# Email attributes returned to the agent by get_unread_emails (keyed by Gmail message ID).
+# thread_id and message_id (RFC 2822 Message-ID) are left out on purpose
+EMAIL_FIELDS = (
+    'subject',
+    'from_email',      # Full "Name <email@domain.com>" format
+    'from_name',       # Just the name part
+    'from_address',    # Just the email part
+    'to',              # List of recipients
+    'cc',              # CC recipients
+    'bcc',             # BCC recipients (rarely available)
+    'reply_to',        # Reply-To header
+    'date',            # Original Date header
+    'received_date',   # When Gmail received it
+    'body_text',       # Plain text body
+    'headers',         # Parsed headers
+)
+
+# Email attributes given to the drafting step (the parsed headers aren't needed)
+DRAFT_EMAIL_FIELDS = EMAIL_FIELDS[:-1]
+
+# C-level getters that fetch all of the above attributes in one call
+_get_email_fields = attrgetter(*EMAIL_FIELDS)
+_get_draft_email_fields = attrgetter(*DRAFT_EMAIL_FIELDS)
+
+# How each calendar event field returned by get_calendar_events is formatted
+EVENT_FORMATTERS = {
+    'id': attrgetter('id'),
+    'summary': lambda event: event.summary or 'No title',
+    'description': attrgetter('description'),
+    'start_time': lambda event: event.start_time.isoformat() if event.start_time else '',
+    'end_time': lambda event: event.end_time.isoformat() if event.end_time else '',
+    'start_date': attrgetter('start_date'),
+    'end_date': attrgetter('end_date'),
+    'is_all_day': attrgetter('is_all_day'),
+    'location': attrgetter('location'),
+    'attendees': lambda event: [attendee.get('email') for attendee in event.attendees],
+    'organizer': lambda event: event.organizer.get('email') if event.organizer else '',
+    'status': attrgetter('status'),
+    'html_link': attrgetter('html_link'),
+}
+
+# Fields get_calendar_events returns unless the agent asks for others. All-day
+# events have only start_date/end_date, and id lets the agent refer back to an event
+DEFAULT_EVENT_FIELDS = ('id', 'summary', 'start_time', 'end_time', 'start_date', 'end_date', 'is_all_day', 'attendees')
+
+# Separators skipped while parsing streamed JSON: between pairs, and around ':'
+_JSON_GAP = re.compile(r"[\s,]*")
+_JSON_WS = re.compile(r"\s*")
+
+# The user's Gmail profile (address, name, signature), fetched once by get_user_profile
+_user_profile: dict = {}
+
+# Line breaks and tags in the user's HTML signature, for turning it into plain text
+_HTML_BREAK = re.compile(r"<br\s*/?>|</(?:p|div|li|tr)>", re.I)
+_HTML_TAG = re.compile(r"<[^>]+>")
+
+# Sender addresses that never expect a reply (no-reply, bounces, notifications, ...)
+_AUTOMATED_SENDER = re.compile(r"(?:no[-_.]?reply|donotreply|postmaster|mailer-daemon|^bounces?[@+-]|notifications?@|alerts?@|newsletter)", re.I)
+
+# Candidates that all score at least this in _reply_score are drafted without
+# asking the LLM which of them need a reply (a colleague asking a question)
+REPLY_SCORE_THRESHOLD = 3
+
+# Free email providers; sharing one of these with the user says nothing about the sender
+FREE_EMAIL_DOMAINS = frozenset({
+    'gmail.com', 'googlemail.com', 'outlook.com', 'hotmail.com', 'live.com',
+    'yahoo.com', 'icloud.com', 'me.com', 'aol.com', 'proton.me', 'protonmail.com'
+})
+
+# URLs are removed before looking for questions (their query strings contain '?')
+_URL = re.compile(r"(?:https?://|www\.)\S+", re.I)
+
+# A question in prose: a question mark right after a word, not followed by more of a token
+_QUESTION = re.compile(r"\w\?(?![\w=&/%.])")
+
+# Anthropic tool schema the reply-selection step must call, so the selected
+# message ids arrive as a typed list instead of text to be parsed
+_SELECT_REPLY_IDS_TOOL = {
+    "name": "select_reply_ids",
+    "description": "Report the Gmail message IDs of the emails that require a response.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "ids": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["ids"]
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def get_gmail_client() -> GmailClient:
+    """Return the Gmail client shared by all tool calls, authenticating on first use"""
+    return GmailClient()
+
+@lru_cache(maxsize=1)
+def get_calendar_client() -> "GoogleCalendarClient":
+    """Return the Calendar client shared by all tool calls, authenticating on first use"""
+    # Imported here so email-only sessions don't load the Calendar client at startup
+    from backend.google.gcal_client import GoogleCalendarClient
+    return GoogleCalendarClient()
+
+def _cache_emails(emails: list[Email]) -> None:
+    """Remember fetched emails for later tool calls, evicting the oldest past the limit"""
+    now = time.monotonic()
+    with _email_cache_lock:
+        for email in emails:
+            _email_cache[email.id] = (now, email)
+            _email_cache.move_to_end(email.id)
+        while len(_email_cache) > EMAIL_CACHE_SIZE:
+            _email_cache.popitem(last=False)
+
+def _get_cached_emails(email_ids: list[str]) -> dict[str, Email]:
+    """Return the cached, unexpired emails among email_ids"""
+    now = time.monotonic()
+    found = {}
+    with _email_cache_lock:
+        for email_id in email_ids:
+            entry = _email_cache.get(email_id)
+            if entry is None:
+                continue
+            if now - entry[0] > EMAIL_CACHE_TTL:
+                del _email_cache[email_id]
+                continue
+            _email_cache.move_to_end(email_id)
+            found[email_id] = entry[1]
+    return found
+
+def _draft_cache_key(info: dict) -> tuple:
+    """Key an email by sender, subject, a hash of the full body and the draft instructions"""
+    return (
+        info['from_email'],
+        info['subject'],
+        hashlib.sha256(info['body_text'].encode()).hexdigest(),
+        info['draft_specications'],
+    )
+
+def _get_cached_draft(key: tuple):
+    """Return the unexpired draft cached under key, or None"""
+    with _draft_cache_lock:
+        entry = _draft_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > DRAFT_CACHE_TTL:
+            del _draft_cache[key]
+            return None
+        _draft_cache.move_to_end(key)
+        return entry[1]
+
+def _cache_draft(key: tuple, draft: str) -> None:
+    """Remember a generated draft, evicting the oldest past the limit"""
+    with _draft_cache_lock:
+        _draft_cache[key] = (time.monotonic(), draft)
+        _draft_cache.move_to_end(key)
+        while len(_draft_cache) > DRAFT_CACHE_SIZE:
+            _draft_cache.popitem(last=False)
+
+def _is_automated(email: Email) -> bool:
+    """True for emails that clearly need no reply: no-reply senders and bulk/auto-generated mail"""
+    headers = email.headers
+    return bool(
+        _AUTOMATED_SENDER.search(email.from_address)
+        or "List-Unsubscribe" in headers
+        or headers.get("Precedence", "").lower() in ("bulk", "list", "junk")
+        or headers.get("Auto-Submitted", "no").lower() != "no"
+    )
 
+def _reply_score(candidate: dict, user_domain: str) -> int:
+    """Rough score of how clearly a (non-automated) email asks for a reply"""
+    snippet = candidate['snippet']
+    score = 0
+    if user_domain not in FREE_EMAIL_DOMAINS and candidate['from_address'].rpartition('@')[2].lower() == user_domain:
+        score += 2  # From someone at the user's own organization
+    if _QUESTION.search(_URL.sub(" ", candidate['subject'])):
+        score += 1  # Asks a question in the subject
+    if _QUESTION.search(_URL.sub(" ", snippet)):
+        score += 1  # Asks a question in the body
+    if 'unsubscribe' in snippet.lower():
+        score -= 2  # Mailing list footer
+    return score
 
 def get_unread_emails(count: int) -> dict:
     """Gets unread emails from the user's Gmail inbox.
@@ -22,158 +241,291 @@ def get_unread_emails(count: int) -> dict:
             data (dict): Email data keyed by ID if successful
             error (str): Error message if unsuccessful
     """
-    g_client = GmailClient()
+    # The inbox rarely changes between back-to-back questions
+    g_client = get_gmail_client()
+
+    cached = _get_cached_unread(g_client, count)
+    if cached is not None:
+        return cached
     
     emails = g_client.get_unread_emails(count)
-    
-    # Convert emails list to dictionary keyed by email ID
-    email_dict = {}
-    for email in emails:
-        email_dict[email.id] = {
-            # Gmail message ID
-            #'thread_id': email.thread_id,        # Gmail thread ID 
-            #'message_id': email.message_id,      # RFC 2822 Message-ID header
-            'subject': email.subject,
-            'from_email': email.from_email,      # Full "Name <email@domain.com>" format
-            'from_name': email.from_name,        # Just the name part
-            'from_address': email.from_address,  # Just the email part
-            'to': email.to,                      # List of recipients
-            'cc': email.cc,                      # CC recipients
-            'bcc': email.bcc,                    # BCC recipients (rarely available)
-            'reply_to': email.reply_to,          # Reply-To header
-            'date': email.date,                  # Original Date header
-            'received_date': email.received_date, # When Gmail received it
-            'body_text': email.body_text,        # Plain text body
-            'headers': email.headers,            # All other headers
-
-        }
 
     # Figure out to get email attachments to be fed as context
     
     # TODO: Figure out how to send the full emails to front end to display
     
+    return _unread_result(g_client, count, emails)
+
+async def aget_unread_emails(count: int) -> dict:
+    """Async version of get_unread_emails, run when the agent is called with ainvoke (achat_with_agent)"""
+    g_client = get_gmail_client()
+
+    cached = _get_cached_unread(g_client, count)
+    if cached is not None:
+        return cached
+
+    emails = await g_client.aget_unread_emails(count)
+    return _unread_result(g_client, count, emails)
+
+def _get_cached_unread(g_client: GmailClient, count: int):
+    """Return the unexpired get_unread_emails result for the client's account and count, or None"""
+    with _unread_cache_lock:
+        cached = _unread_cache.get((g_client.token_path, count))
+    if cached is not None and time.monotonic() - cached[0] < UNREAD_CACHE_TTL:
+        return cached[1]
+    return None
+
+def _clear_unread_cache() -> None:
+    """Forget every cached get_unread_emails result (the mailbox changed)"""
+    with _unread_cache_lock:
+        _unread_cache.clear()
+
+def _unread_result(g_client: GmailClient, count: int, emails: list[Email]) -> dict:
+    """Cache fetched unread emails and build the tool result: email data keyed by ID"""
+    _cache_emails(emails)
+    
+    # Convert emails list to dictionary keyed by email ID
+    email_dict = {email.id: dict(zip(EMAIL_FIELDS, _get_email_fields(email))) for email in emails}
+    with _unread_cache_lock:
+        _unread_cache[(g_client.token_path, count)] = (time.monotonic(), email_dict)
     return email_dict
 
 def create_drafts_for_unread_emails(email_info_dict: dict[str, str]) -> dict:
-    """ 
-    This tool will create drafts to respond to the unread emails. Use this tool when you need to create drafts to the user's unread emails.
-    This tool will also decide which emails require a response and which emails do not.
-    Only use this tool if the user has unread emails.
-
-    Use the value in the parameter email_info_dict to include information about the draft that needs to be created for the respective email_id. Use this value to indicate that a meeting is being created, to pass important user information, etc.
+    """Decide which unread emails need a reply and create drafts for them in the user's drafts folder.
 
     Args:
-        email_info_dict(dict[str, str]): A dictionary where keys are google message email ids and values are strings containing important information that is required for the drat creating agent. Use the get_unread_emails tool to get the google message email ids.
+        email_info_dict(dict[str, str]): Gmail message ids (from get_unread_emails) mapped to extra instructions for each draft, such as meeting details or user information. Use an empty string for none.
     Returns:
         A dictionary of email ids and their drafts.
     """
-    g_client = GmailClient()
-    emails_dict = {}
-    drafts = []
-    email_objs = {}
+    g_client = get_gmail_client()
 
     # Extract email IDs from the dictionary keys
     email_ids = list(email_info_dict.keys())
 
-    for email_id in email_ids:
-        email_obj = g_client.fetch_email_by_msg_id(email_id)[0]
-        email_objs[email_id] = email_obj
-        emails_dict[email_id] = {
-            'subject': email_obj.subject,
-            'from_email': email_obj.from_email,
-            'from_name': email_obj.from_name,
-            'from_address': email_obj.from_address,
-            'to': email_obj.to,
-            'cc': email_obj.cc,
-            'bcc': email_obj.bcc,
-            'reply_to': email_obj.reply_to,
-            'date': email_obj.date,
-            'received_date': email_obj.received_date,
-            'body_text': email_obj.body_text,
+    # Reuse emails get_unread_emails already fetched; fetch the rest in one batched request
+    email_objs = _get_cached_emails(email_ids)
+    missing_ids = [email_id for email_id in email_ids if email_id not in email_objs]
+    if missing_ids:
+        email_objs.update(g_client.fetch_emails_by_msg_ids(missing_ids))
+
+    emails_dict = {
+        email_id: {
+            **dict(zip(DRAFT_EMAIL_FIELDS, _get_draft_email_fields(email_obj))),
             'draft': '',
             'draft_specications': email_info_dict[email_id]
         }
+        for email_id, email_obj in email_objs.items()
+    }
     
-    emails_for_llm = str(emails_dict)
-
-    # Ask LLM to get the msgs_ids that are needed to be replied to 
-    prompt_content = prompts.get_msg_ids_prompt(emails_for_llm)
-    messages = [
-        {"role": "system", "content": prompt_content},
-        {"role": "user", "content": "follow the prompt exactly"}
-    ]
-    response = init_llm.claude.invoke(messages)
-
-    # The response is an AIMessage object, not a dictionary
-    msg_id_from_llm = response.content
-
-    # Convert response to python list 
-    email_ids_from_llm = ast.literal_eval(msg_id_from_llm)
+    # No-reply senders and bulk mail never need a draft; only ask the LLM about the rest.
+    # Choosing which emails need a reply only takes who sent what, so send a slim
+    # summary here and keep the full email data for the drafting call
+    candidates = {
+        email_id: {
+            'subject': info['subject'],
+            'from_name': info['from_name'],
+            'from_address': info['from_address'],
+            'to': info['to'],
+            'snippet': info['body_text'][:SELECTION_SNIPPET_CHARS],
+            'draft_specications': info['draft_specications'],
+        }
+        for email_id, info in emails_dict.items() if not _is_automated(email_objs[email_id])
+    }
 
-    # Create drafts
-    draft_messages = [
-            {"role": "user", "content": "follow the prompts exactly. I will give them to you in the next message."}
+    email_ids_from_llm = []
+    user_profile = get_user_profile() if candidates else {}
+    user_domain = user_profile.get('email', '').rpartition('@')[2].lower()
+    if user_domain and all(_reply_score(candidate, user_domain) >= REPLY_SCORE_THRESHOLD for candidate in candidates.values()):
+        # Every remaining email clearly needs a reply; skip the selection call
+        email_ids_from_llm = list(candidates)
+    elif candidates:
+        emails_for_llm = _to_llm_json(candidates)
+
+        # Ask LLM to get the msgs_ids that are needed to be replied to 
+        # Static criteria in the system prompt, this call's emails in the user message
+        messages = [
+            {"role": "system", "content": prompts.get_msg_ids_system_prompt()},
+            {"role": "user", "content": prompts.get_msg_ids_user_payload(emails_for_llm)}
         ]
-    
-    # TODO: add a function that gets the user profile from user gmail such as name, title, signature etc. 
-
-    for email_id in email_ids_from_llm:
-        # Ask LLM to create a draft for the email
-        email_info = str(emails_dict[email_id])
+        # Force a call to the select_reply_ids tool so the ids come back as structured data.
+        # Picking ids is a simple extraction, so the smaller model handles it
+        response = init_llm.get_claude_haiku().bind_tools(
+            [_SELECT_REPLY_IDS_TOOL],
+            tool_choice=_SELECT_REPLY_IDS_TOOL["name"]
+        ).invoke(messages)
+
+        # The response is an AIMessage object whose tool call holds the already-parsed ids
+        if response.tool_calls:
+            email_ids_from_llm = [email_id for email_id in response.tool_calls[0]["args"].get("ids", []) if email_id in candidates]
+
+    # Emails with the same content as one already drafted (the same email seen again) reuse that draft;
+    # only the rest go to the LLM
+    draft_keys = {email_id: _draft_cache_key(emails_dict[email_id]) for email_id in email_ids_from_llm}
+    cached_drafts = {}
+    for email_id, key in draft_keys.items():
+        draft = _get_cached_draft(key)
+        if draft is not None:
+            cached_drafts[email_id] = draft
+    ids_to_draft = [email_id for email_id in email_ids_from_llm if email_id not in cached_drafts]
+
+    # Ask LLM to create the drafts for the remaining selected emails in streamed requests
+    draft_futures = {}
+    draft_ids = {}
+    if email_ids_from_llm:
+        # Drafts are signed as the user, with their Gmail name and signature
+        profile_json = _to_llm_json(_drafting_profile(user_profile))
+
+        # Send to drafts via API as soon as each draft is complete in the stream, so
+        # Gmail round trips overlap with the rest of the generation. Each drafts.create
+        # is independent, so they run concurrently (HTTP connections are per thread)
+        with ThreadPoolExecutor(max_workers=min(MAX_GMAIL_WORKERS, len(email_ids_from_llm))) as executor:
+            def submit_draft(email_id: str, draft: str) -> None:
+                emails_dict[email_id]['draft'] = draft
+                
+                # Update the email object with the draft
+                email_objs[email_id].draft = draft
+                draft_futures[email_id] = executor.submit(g_client.create_draft_from_email, email_objs[email_id])
+
+            def stream_drafts(group_ids: list[str]) -> None:
+                emails_json = _to_llm_json(
+                    [{"id": email_id, "email_info": emails_dict[email_id]} for email_id in group_ids]
+                )
+                draft_messages = [
+                    {"role": "user", "content": prompts.get_batch_drafting_prompt(emails_json, profile_json)}
+                ]
+
+                stream = init_llm.get_drafting_claude().stream(draft_messages)
+                for email_id, draft in _iter_json_object_items(_chunk_text(chunk) for chunk in stream):
+                    # Ignore ids the LLM made up, repeated, or that belong to another request
+                    if email_id not in group_ids or email_id in draft_futures:
+                        continue
+                    _cache_draft(draft_keys[email_id], draft)
+                    submit_draft(email_id, draft)
+
+            # Drafts reused from the cache are all known up front, so they're created in one batch
+            cached_future = None
+            if cached_drafts:
+                for email_id, draft in cached_drafts.items():
+                    emails_dict[email_id]['draft'] = draft
+                    email_objs[email_id].draft = draft
+                cached_future = executor.submit(
+                    g_client.create_drafts_from_emails, [email_objs[email_id] for email_id in cached_drafts]
+                )
+
+            # Drafts are generated one after another within a request, so larger
+            # batches are split into requests that stream concurrently
+            groups = [ids_to_draft[start:start + DRAFTS_PER_REQUEST] for start in range(0, len(ids_to_draft), DRAFTS_PER_REQUEST)]
+            if groups:
+                with ThreadPoolExecutor(max_workers=min(MAX_LLM_WORKERS, len(groups))) as llm_executor:
+                    for future in [llm_executor.submit(stream_drafts, group_ids) for group_ids in groups]:
+                        future.result()
+
+            if cached_future:
+                draft_ids.update(cached_future.result())
+            for email_id, future in draft_futures.items():
+                draft_ids[email_id] = future.result()
+
+            for email_id, draft_id in draft_ids.items():
+                email_objs[email_id].draft_id = draft_id
+                emails_dict[email_id]['draft_id'] = draft_id
+
+                # Give AI ready_to_send field (False by default)
+                emails_dict[email_id]['ready_to_send'] = email_objs[email_id].ready_to_send
+
+        if ids_to_draft and not draft_futures:
+            print("Error parsing drafts from LLM: no complete drafts in the response")
+
+    drafted_ids = list(draft_ids)
+
+    # Mark the emails as read in a single request
+    g_client.mark_many_as_read(drafted_ids)
+    if drafted_ids:
+        _clear_unread_cache()
 
-        draft_prompt_content = prompts.get_drating_agent_prompt(email_info)
-        draft_messages.append({"role": "user", "content": draft_prompt_content})
+    # TODO: Figure out how to send the drafts to front end to display
+    return emails_dict
 
-        draft_response = init_llm.claude.invoke(draft_messages)
-        # The draft_response is also an AIMessage object
-        emails_dict[email_id]['draft'] = draft_response.content
-        
-        # Update the email object with the draft
-        email_objs[email_id].draft = draft_response.content
+def _drafting_profile(profile: dict) -> dict:
+    """The parts of the user's profile a draft needs: their name and a plain-text signature"""
+    signature = _HTML_TAG.sub("", _HTML_BREAK.sub("\n", profile.get('signature', '')))
+    return {
+        'name': profile.get('name', ''),
+        'signature': "\n".join(line.strip() for line in html.unescape(signature).splitlines() if line.strip()),
+    }
 
-        # Send to drafts via API
-        draft_id = g_client.create_draft_from_email(email_objs[email_id])
-        email_objs[email_id].draft_id = draft_id
-        emails_dict[email_id]['draft_id'] = draft_id
+def _to_llm_json(data) -> str:
+    """Serialize tool data for a prompt as compact JSON with a stable key order"""
+    # orjson handles datetimes natively; default=str covers anything else
+    return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS).decode()
 
-        draft_messages.append({"role": "assistant", "content": draft_response.content})
-        
-        # Give AI ready_to_send field (False by default)
-        emails_dict[email_id]['ready_to_send'] = email_objs[email_id].ready_to_send
+def _chunk_text(chunk) -> str:
+    """Return the text of a streamed message chunk (plain string or content blocks)"""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
 
-        # Mark the email as read
-        g_client.mark_as_read(email_id)
-
-    # TODO: Figure out how to send the drafts to front end to display
-    return emails_dict
+def _iter_json_object_items(text_chunks):
+    """
+    Yield the (key, value) pairs of a JSON object as its text streams in.
+    
+    Each pair is yielded as soon as its value is complete, without waiting for the
+    rest of the object. Text before the opening brace (e.g. a markdown fence) is
+    skipped; an incomplete or malformed remainder simply yields nothing more.
+    
+    Args:
+        text_chunks: Iterable of text fragments that together form the JSON object
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    in_object = False
+    for chunk in text_chunks:
+        buffer += chunk
+        if not in_object:
+            start = buffer.find("{")
+            if start < 0:
+                continue
+            buffer = buffer[start + 1:]
+            in_object = True
+
+        while True:
+            # Next pair: "key": value, after any whitespace or comma
+            pos = _JSON_GAP.match(buffer).end()
+            if pos == len(buffer) or buffer[pos] == "}":
+                break
+            try:
+                key, pos = decoder.raw_decode(buffer, pos)
+                pos = _JSON_WS.match(buffer, pos).end()
+                if buffer[pos:pos + 1] != ":":
+                    break
+                value, pos = decoder.raw_decode(buffer, _JSON_WS.match(buffer, pos + 1).end())
+            except json.JSONDecodeError:
+                break  # The pair isn't complete yet; wait for more text
+            yield key, value
+            # Drop consumed text so the buffer only holds the pair in progress
+            buffer = buffer[pos:]
 
 def send_drafts(draft_ids: list[str], confirmation: bool) -> dict:
-    """ 
-    Use this tool only after you have called create_drafts_for_unread_emails tool.
-    This tool will send the created drafts to the intended recipients.
-    To use this tool, you need to ask confirm with user if they want to send the drafts as well as which drafts to send.
-    Make sure to change the status of the draft under the field 'status' to 'sent' if the user confirmed to send the draft AFTER calling this tool and receive True.
+    """Send drafts the user confirmed.
 
     Args:
-        draft_ids(list[str]): A list of google message email ids for the drafts that the user CONFIRMED to send. Use the draft_id field from the dict returned by the create_drafts_for_unread_emails tool.
-        confirmation(bool): A boolean value that indicates if the user confirmed to send the drafts listed in the draft_ids parameter.
-    
+        draft_ids(list[str]): draft_id values (from create_drafts_for_unread_emails) of the drafts the user confirmed to send.
+        confirmation(bool): Whether the user confirmed sending these drafts.
     Return:
-        A dictionary of draft ids and their status. True if sent successfully, False if not. Report to the user which drafts were sent successfully and which were not.
+        A dictionary of draft ids and their status. True if sent successfully, False if not.
     """
 
-    g_client = GmailClient()
-    status = {}
-    for draft_id in draft_ids:
-        status[draft_id] = g_client.send_draft(draft_id)
+    g_client = get_gmail_client()
+
+    # Send every draft in one batched request
+    status = g_client.send_drafts(draft_ids)
+    _clear_unread_cache()
 
     return status
 
 def edit_existing_draft(draft_ids: str, new_body: str, new_subject: str, new_to: list[str], new_cc: list[str], new_bcc: list[str], new_reply_to: str, thread_id: str) -> dict:
-    """
-    Use this tool to edit an existing draft. Use this tool only when the user requests to edit a particular draft. Must have used the create_drafts_for_unread_emails tool to prior to using this tool.
-    Make sure to update the dict element of the draft_id (from the create_drafts_for_unread_emails tool) changed with the new values after receiving the output from this tool.
-    Args are for the new values of the draft. If the user does not specify a new value, pass an empty string or list.
+    """Edit an existing draft. Pass an empty string or list for any value the user didn't change.
 
     Args:
         draft_ids(str): The draft id of the draft to edit.
@@ -186,14 +538,17 @@ def edit_existing_draft(draft_ids: str, new_body: str, new_subject: str, new_to:
         thread_id(str): The thread id of the draft.
 
     Returns:
-        A dict of the draft_id with its new updated values. Use this return value to update the email dict in chat history.
-
+        A dict of the draft_id with its new updated values.
     """
 
-    g_client = GmailClient()
+    g_client = get_gmail_client()
     
-    # Call the Gmail client method
-    result = g_client.edit_existing_draft(draft_ids, new_body, new_subject, new_to, new_cc, new_bcc)
+    # Call the Gmail client method. Empty values mean "not specified" for this tool,
+    # so they're passed as None to keep the draft's current ones
+    result = g_client.edit_existing_draft(
+        draft_ids, new_body or None, new_subject or None, new_to or None, new_cc or None, new_bcc or None,
+        thread_id=thread_id or None
+    )
     
     # Check if the operation was successful
     if result.startswith("Error editing draft"):
@@ -212,43 +567,26 @@ def edit_existing_draft(draft_ids: str, new_body: str, new_subject: str, new_to:
     return return_dict
     
 
-def get_calendar_events(days: int = 7) -> dict:
-    """
-    Get upcoming calendar events for the user. Use this tool when the user requests to see their calendar events. or if a response requires a calendar event k number of days in the future. 
-    This tool is meant to help you understand the user's calendar events and schedule a calendar event if needed.
+def get_calendar_events(days: int = 7, fields: list[str] = None) -> dict:
+    """Get the user's upcoming calendar events.
     
     Args:
-        days(int): Number of days to get events for. Default is 7 days. Adjust the parameter based on the user's requests or if an email response requires a calendar event n number of days in the future.
+        days(int): Number of days ahead to get events for. Default is 7.
+        fields(list[str]): Event fields to return. Defaults to id, summary, start_time, end_time, start_date, end_date, is_all_day and attendees. Also available: description, location, organizer, status, html_link.
         
     Returns:
         dict: Dictionary containing:
             success (bool): Whether the operation succeeded
             events (list): List of upcoming calendar events
     """
-    calendar_client = GoogleCalendarClient()
+    calendar_client = get_calendar_client()
     
     # Get upcoming events as Event objects
     events = calendar_client.get_upcoming_events_as_objects(days=days, max_results=999)
     
-    # Format events for easier consumption
-    formatted_events = []
-    for event in events:
-        formatted_event = {
-            'id': event.id,
-            'summary': event.summary or 'No title',
-            'description': event.description,
-            'start_time': event.start_time.isoformat() if event.start_time else '',
-            'end_time': event.end_time.isoformat() if event.end_time else '',
-            'start_date': event.start_date,
-            'end_date': event.end_date,
-            'is_all_day': event.is_all_day,
-            'location': event.location,
-            'attendees': [attendee.get('email') for attendee in event.attendees],
-            'organizer': event.organizer.get('email') if event.organizer else '',
-            'status': event.status,
-            'html_link': event.html_link
-        }
-        formatted_events.append(formatted_event)
+    # Format events for easier consumption, computing only the requested fields
+    formatters = [(name, EVENT_FORMATTERS[name]) for name in (fields or DEFAULT_EVENT_FIELDS) if name in EVENT_FORMATTERS]
+    formatted_events = [{name: format_field(event) for name, format_field in formatters} for event in events]
     
     return {
         'success': True,
@@ -273,7 +611,7 @@ def set_meeting(summary: str, description: str = None, start_time: str = None, e
             event_id (str): ID of the created event
             error (str): Error message if unsuccessful
     """
-    calendar_client = GoogleCalendarClient()
+    calendar_client = get_calendar_client()
     
     # Parse datetime strings
     from datetime import datetime
@@ -312,4 +650,15 @@ def set_meeting(summary: str, description: str = None, start_time: str = None, e
 def get_user_profile() -> dict:
     """ Use this tool to get the user's profile from their gmail.
     """
-TOOLS = [get_unread_emails, create_drafts_for_unread_emails, send_drafts, edit_existing_draft, get_calendar_events]
\ No newline at end of file
+    # The profile doesn't change during a session, so fetch it once per process.
+    # Failed lookups (empty dict) aren't cached and are retried on the next call
+    global _user_profile
+    if not _user_profile:
+        _user_profile = get_gmail_client().get_user_profile()
+    return _user_profile
+
+TOOLS = [get_unread_emails, create_drafts_for_unread_emails, send_drafts, edit_existing_draft, get_calendar_events]
+
+# Async versions of tools, used instead of running the sync tool in a worker
+# thread when the agent runs with ainvoke
+ASYNC_TOOLS = {get_unread_emails: aget_unread_emails}
\ No newline at end of file
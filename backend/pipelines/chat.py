@@ -5,48 +5,243 @@ This module handles the conversation flow between users and the AI agent,
 including thread management and response processing.
 """
 
+from collections import OrderedDict
+import threading
+import time
+from typing import Optional
 import uuid
 
+__all__ = ['ResponseCache', 'chat_with_agent', 'stream_chat_with_agent', 'achat_with_agent', 'create_chat_id']
 
-def chat_with_agent(agent, user_input: str, thread_id: str):
+# Replies kept by the response cache, and for how long (seconds)
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 1800
+
+
+class ResponseCache:
+    """
+    Cache of agent replies for repeated one-off messages.
+    
+    Only messages sent without a thread_id are cached: each starts a new
+    thread with no history, so the reply depends on the message alone and is
+    keyed on it (ignoring case and whitespace). Messages in an ongoing thread
+    always reach the agent. Only turns that called no tools are cached: tool
+    results (the inbox, the calendar) go stale, and tools like send_drafts
+    must run again when asked again.
+    
+    >>> cache = ResponseCache()
+    >>> cache.set(cache.key("What can you do?", None), "I can help with your email.")
+    >>> cache.get(cache.key("  what can you DO? ", None))
+    'I can help with your email.'
+    >>> cache.key("What can you do?", "some-thread") is None
+    True
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, user_input: str, thread_id: Optional[str]) -> Optional[str]:
+        """Cache key for a message, or None if it continues a thread and can't be cached"""
+        if thread_id:
+            return None
+        return " ".join(user_input.lower().split())
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """Return the cached, unexpired reply for key, or None"""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Optional[str], ai_response: str) -> None:
+        """Cache the agent's reply for key, evicting the least recently used past maxsize"""
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), ai_response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Shared by chat_with_agent, stream_chat_with_agent and achat_with_agent
+_response_cache = ResponseCache()
+
+
+def chat_with_agent(agent, user_input: str, thread_id: Optional[str] = None):
     """
     Process a user message through the AI agent and return the response.
     
     This function handles the conversation flow by invoking the agent with
     the user's input and maintaining conversation context through thread IDs.
+    A repeated one-off message (no thread_id) is answered from the response cache.
     
     Args:
         agent: The LangGraph agent instance to use for processing
         user_input (str): The user's message to process
-        thread_id (str): Unique identifier for the conversation thread
+        thread_id (str): Unique identifier for the conversation thread (a new thread is started if omitted)
         
     Returns:
         str: The AI agent's response to the user's input
     """
-    # Ensure we have a valid thread ID for conversation tracking
-    if not thread_id:
-        thread_id = create_chat_id()
-        print ("USING CHAT ID: ", thread_id)
+    # Repeated one-off messages are answered from the cache without running the agent
+    cache_key = _response_cache.key(user_input, thread_id)
+    cached_response = _response_cache.get(cache_key)
+    if cached_response is not None:
+        return cached_response
 
-    # Configure the agent with the thread ID for conversation continuity
-    config = {
-    "configurable": {
-        "thread_id": thread_id
-            }
-        }
-    
     # Invoke the agent with the user's message and thread configuration
     response = agent.invoke(
         {"messages": [{"role": "user", "content": user_input}]},
-        config=config
+        config=_thread_config(thread_id)
     )
     
     # Extract the AI's response from the last message in the conversation
-    ai_response = response['messages'][-1].content
+    return _cache_reply(cache_key, response['messages'])
+
+
+def stream_chat_with_agent(agent, user_input: str, thread_id: Optional[str] = None):
+    """
+    Streaming version of chat_with_agent that yields the response as it's generated.
     
+    Text is forwarded token by token from every model step of the agent, so the
+    user sees output right away instead of after the whole run (tool calls
+    included) has finished. Text from different steps is separated by a blank line.
+    
+    Args:
+        agent: The LangGraph agent instance to use for processing
+        user_input (str): The user's message to process
+        thread_id (str): Unique identifier for the conversation thread (a new thread is started if omitted)
+        
+    Yields:
+        str: Pieces of the AI agent's response text
+    """
+    cache_key = _response_cache.key(user_input, thread_id)
+    cached_response = _response_cache.get(cache_key)
+    if cached_response is not None:
+        yield cached_response
+        return
+
+    config = _thread_config(thread_id)
+    message_id = None  # Model message the last yielded text belonged to
+    for chunk, metadata in agent.stream(
+        {"messages": [{"role": "user", "content": user_input}]},
+        config=config,
+        stream_mode="messages"
+    ):
+        # Only model output; tool results are streamed as messages too
+        if metadata.get("langgraph_node") == "agent":
+            text = _message_text(chunk)
+            if text:
+                # Each model step is a separate message; keep their texts apart
+                if message_id is not None and chunk.id != message_id:
+                    yield "\n\n"
+                message_id = chunk.id
+                yield text
+
+    # The finished turn, read back from the thread, decides whether it's cacheable
+    _cache_reply(cache_key, agent.get_state(config).values["messages"])
+
+
+async def achat_with_agent(agent, user_input: str, thread_id: Optional[str] = None):
+    """
+    Async version of chat_with_agent for use inside an event loop (e.g. a web server).
+    
+    The agent runs with ainvoke, so model calls don't block the event loop and
+    several conversations can be in flight at once. Tools with an async
+    version (tools.ASYNC_TOOLS, e.g. get_unread_emails) are awaited; LangGraph
+    runs the other, sync tools in worker threads.
+    
+    Args:
+        agent: The LangGraph agent instance to use for processing
+        user_input (str): The user's message to process
+        thread_id (str): Unique identifier for the conversation thread (a new thread is started if omitted)
+        
+    Returns:
+        str: The AI agent's response to the user's input
+    """
+    cache_key = _response_cache.key(user_input, thread_id)
+    cached_response = _response_cache.get(cache_key)
+    if cached_response is not None:
+        return cached_response
+
+    response = await agent.ainvoke(
+        {"messages": [{"role": "user", "content": user_input}]},
+        config=_thread_config(thread_id)
+    )
+    
+    # Extract the AI's response from the last message in the conversation
+    return _cache_reply(cache_key, response['messages'])
+
+
+def _cache_reply(cache_key: Optional[str], messages: list) -> str:
+    """Return the reply from a finished turn, caching it if the turn called no tools"""
+    _check_prompt_cache(messages)
+    ai_response = messages[-1].content
+    if not _called_tools(messages):
+        _response_cache.set(cache_key, ai_response)
     return ai_response
 
 
+def _check_prompt_cache(messages: list) -> None:
+    """Warn if no model call in the latest turn read or wrote Anthropic's prompt cache"""
+    reported = False
+    for message in reversed(messages):
+        if getattr(message, "type", None) == "human":
+            break
+        usage = getattr(message, "usage_metadata", None)
+        if usage:
+            reported = True
+            details = usage.get("input_token_details", {})
+            if details.get("cache_read") or details.get("cache_creation"):
+                return
+    if reported:
+        print("Warning: the agent's prompt prefix was not cached (no cache_read or cache_creation tokens)")
+
+
+def _called_tools(messages: list) -> bool:
+    """True if the latest turn (messages after the last user message) called any tool"""
+    for message in reversed(messages):
+        if getattr(message, "type", None) == "human":
+            break
+        if getattr(message, "tool_calls", None):
+            return True
+    return False
+
+
+def _message_text(message) -> str:
+    """Return the text of a message (chunk), whose content is a string or content blocks"""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict) and block.get("type") == "text")
+
+
+def _thread_config(thread_id: Optional[str]) -> dict:
+    """Build the agent config for a conversation thread, creating an ID if needed"""
+    # Ensure we have a valid thread ID for conversation tracking
+    if not thread_id:
+        thread_id = create_chat_id()
+        print ("USING CHAT ID: ", thread_id)
+
+    # Configure the agent with the thread ID for conversation continuity
+    return {
+        "configurable": {
+            "thread_id": thread_id
+        }
+    }
+
+
 def create_chat_id() -> str:
     """
     Generate a unique identifier for a chat session.
@@ -5,11 +5,8 @@ This module provides the main interface for interacting with the AI agent
 that can help with email management, drafting responses, and other tasks.
 """
 
-from backend.llm.agent import agent
-from backend.pipelines.chat import chat_with_agent, create_chat_id
-from backend.llm.tools import create_drafts_for_unread_emails
-from backend.google.gmail_client import GmailClient
-from backend.google.gcal_client import GoogleCalendarClient
+from backend.llm.agent import get_agent
+from backend.pipelines.chat import create_chat_id, stream_chat_with_agent
 
 
 def test1():
@@ -21,7 +18,7 @@ def test1():
     and tool results in a formatted output.
     """
     # Invoke the agent with a test query about unread emails
-    result = agent.invoke(
+    result = get_agent().invoke(
         {"messages": [{"role": "user", "content": "what are my unread emails? Max 10"}]}
     )
     
@@ -91,9 +88,11 @@ def run_chat():
             print("Goodbye!")
             break
 
-        # Get AI response using the chat pipeline
-        ai_response = chat_with_agent(agent, user_input, thread_id)
-        print(f"\n\nClaude: {ai_response}")
+        # Print the AI response as the chat pipeline streams it
+        print("\n\nClaude: ", end="", flush=True)
+        for text in stream_chat_with_agent(get_agent(), user_input, thread_id):
+            print(text, end="", flush=True)
+        print()
 
 def main():
     """